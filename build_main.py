@@ -129,6 +129,7 @@ a = Analysis(
         'win32process',
         'win32file',
         'win32security',
+        'icon_diagnostics',
         'PIL',
         'PIL.Image',
         'PIL.ImageQt',
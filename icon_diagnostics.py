@@ -0,0 +1,136 @@
+"""Icon extraction diagnostics for the launcher's Icon Diagnostics dialog.
+
+Kept out of main.py and imported on first use, since it is only needed when the
+dialog is opened.
+"""
+
+import html
+import os
+
+
+def get_icon_diagnostics(file_path: str, launcher) -> dict:
+    """
+    Get diagnostic information about icon extraction for a file.
+    This helps users understand what's happening with their icons.
+    
+    ``launcher`` is the main launcher module, which provides the icon extraction functions.
+    """
+    diagnostics = {
+        'file_path': file_path,
+        'file_exists': False,
+        'file_type': 'unknown',
+        'extraction_methods': [],
+        'available_sizes': [],
+        'errors': [],
+        'recommendations': [],
+        'cached_sizes': []
+    }
+
+    try:
+        file_path = launcher._resolved(file_path)
+        diagnostics['file_path'] = file_path
+        diagnostics['file_exists'] = os.path.exists(file_path)
+
+        if not diagnostics['file_exists']:
+            diagnostics['errors'].append("File does not exist")
+            return diagnostics
+
+        # Determine file type
+        diagnostics['file_type'] = launcher._file_kind(file_path)
+
+        # What the grid already extracted for this file; the win32 test below also reuses
+        # the prewarmed raw image instead of asking the shell again
+        diagnostics['cached_sizes'] = sorted({
+            size for path, sizes in list(launcher._ICON_CACHE) if path == file_path for size in sizes
+        })
+
+        # Test different extraction methods
+        if launcher._win32():
+            try:
+                win32_icon = launcher._extract_with_win32(file_path, 32)
+                if win32_icon and not win32_icon.isNull():
+                    diagnostics['extraction_methods'].append('win32_api')
+                    diagnostics['available_sizes'].extend([s.width() for s in win32_icon.availableSizes()])
+                else:
+                    diagnostics['errors'].append("Win32 API extraction failed")
+            except Exception as e:
+                diagnostics['errors'].append(f"Win32 API error: {str(e)}")
+        else:
+            diagnostics['recommendations'].append("Install pywin32 for better icon extraction")
+
+        # Test system icon extraction
+        try:
+            system_icon = launcher._extract_system_icon(file_path)
+            if system_icon and not system_icon.isNull():
+                diagnostics['extraction_methods'].append('system_icon')
+                diagnostics['available_sizes'].extend([s.width() for s in system_icon.availableSizes()])
+            else:
+                diagnostics['errors'].append("System icon extraction failed")
+        except Exception as e:
+            diagnostics['errors'].append(f"System icon error: {str(e)}")
+
+        # Test default icon
+        try:
+            default_icon = launcher._get_default_icon(file_path)
+            if default_icon and not default_icon.isNull():
+                diagnostics['extraction_methods'].append('default_icon')
+                diagnostics['available_sizes'].extend([s.width() for s in default_icon.availableSizes()])
+            else:
+                diagnostics['errors'].append("Default icon extraction failed")
+        except Exception as e:
+            diagnostics['errors'].append(f"Default icon error: {str(e)}")
+
+        # Remove duplicates and sort sizes
+        diagnostics['available_sizes'] = sorted(list(set(diagnostics['available_sizes'])))
+
+        # Generate recommendations
+        if not diagnostics['extraction_methods']:
+            diagnostics['recommendations'].append("No icon extraction methods succeeded")
+        elif len(diagnostics['extraction_methods']) == 1:
+            diagnostics['recommendations'].append("Only one extraction method working - consider fallbacks")
+
+        if not diagnostics['available_sizes']:
+            diagnostics['recommendations'].append("No icon sizes available - check file format")
+        elif max(diagnostics['available_sizes']) < 48:
+            diagnostics['recommendations'].append("Icons may appear small - enable high-quality scaling")
+
+        if diagnostics['file_type'] == 'executable' and 'win32_api' not in diagnostics['extraction_methods']:
+            diagnostics['recommendations'].append("For executables, install pywin32 for best results")
+
+    except Exception as e:
+        diagnostics['errors'].append(f"General error: {str(e)}")
+
+    return diagnostics
+
+
+def _html_section(title: str, lines) -> str:
+    """One titled block of the diagnostics report; ``lines`` may be any iterable."""
+    body = "<br>".join(html.escape(line) for line in lines)
+    return f"<p><b>{html.escape(title)}</b><br>{body}</p>"
+
+
+def diagnostics_html(diagnostics: dict, cache_info: dict) -> str:
+    """Render get_icon_diagnostics() results as the HTML report shown in the dialog."""
+    def status_lines():
+        yield f"File exists: {'✓' if diagnostics['file_exists'] else '✗'}"
+        yield f"File type: {diagnostics['file_type']}"
+        if diagnostics.get('cached_sizes'):
+            yield f"Cached sizes: {', '.join(map(str, diagnostics['cached_sizes']))}"
+        yield (f"Icon cache: {cache_info['currsize']}/{cache_info['maxsize']} entries, "
+               f"{cache_info['hits']} hits, {cache_info['misses']} misses")
+
+    methods = diagnostics['extraction_methods']
+    sizes = diagnostics['available_sizes']
+    sections = [
+        _html_section("File status", status_lines()),
+        _html_section("Extraction methods",
+                      (f"  ✓ {method}" for method in methods) if methods else ["  ✗ None working"]),
+        _html_section("Available icon sizes", [f"  {', '.join(map(str, sizes))}" if sizes else "  None"]),
+    ]
+    if diagnostics['errors']:
+        sections.append(_html_section("Errors", (f"  ✗ {error}" for error in diagnostics['errors'])))
+    if diagnostics['recommendations']:
+        sections.append(_html_section("Recommendations",
+                                      (f"  💡 {rec}" for rec in diagnostics['recommendations'])))
+    # Keep the leading spaces that indent the list entries
+    return f"<div style='white-space: pre-wrap'>{''.join(sections)}</div>"
@@ -1,611 +1,1020 @@
+import copy
+import functools
+import hashlib
 import json
+import logging
 import os
-import subprocess
 import sys
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
-from PySide6.QtCore import Qt, QSize, QFileInfo, QMimeData, QTimer
-from PySide6.QtGui import QIcon, QPixmap, QKeySequence, QShortcut, QDrag, QColor, QAction
+from PySide6.QtCore import (
+    Qt, QRect, QEvent, QFileInfo, QMimeData, QObject, QTimer, QRunnable, QThreadPool, Signal
+)
+from PySide6.QtGui import (
+    QIcon, QImage, QPixmap, QKeySequence, QShortcut, QDrag, QColor, QAction, QPixmapCache,
+    QPainter
+)
 from PySide6.QtWidgets import (
     QApplication, QFileIconProvider, QGridLayout, QHBoxLayout, QInputDialog,
     QLabel, QLineEdit, QMenu, QMessageBox,
-    QPushButton, QToolButton, QVBoxLayout, QWidget,
+    QPushButton, QVBoxLayout, QWidget,
     QFileDialog, QStyle, QSplitter, QScrollArea, QSystemTrayIcon
 )
 
 from template_app.ui.main_window_base import MainWindowBase
-from template_app.config import load_app_settings, project_root
-from template_app.styles import apply_app_style
 
-# Icon extraction imports - with fallbacks
-try:
-    import win32gui
-    import win32con
-    import win32api
-    import win32ui
-    HAS_WIN32 = True
-except ImportError:
-    HAS_WIN32 = False
+# Icon extraction imports - resolved lazily on first use to keep startup fast
+HAS_WIN32 = None  # tri-state: None = not probed yet, then True/False
 
+# Faster JSON for the config file when available
 try:
-    from PIL import Image
-    import tempfile
-    HAS_PIL = True
+    import orjson
 except ImportError:
-    HAS_PIL = False
+    orjson = None
 
 
 APP_NAME = "SuperLauncher"
+# The launcher's own icon, shared by the window, the application and the tray
+APP_ICON_PATH = "template_app/assets/icons/icon2.png"
 
+logger = logging.getLogger(__name__)
 
-class IconExtractor:
-    """Extract icons from Windows executables and files using multiple fallback methods."""
+# Shared dark styling for every popup menu (context, add, options and tray menus)
+DARK_MENU_QSS = """
+    QMenu {
+        background-color: #2a2a2a;
+        color: #ffffff;
+        border: 1px solid #404040;
+        border-radius: 0px;
+        padding: 4px 0px;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 12px;
+    }
+    QMenu::item {
+        background-color: transparent;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 0px;
+    }
+    QMenu::item:selected {
+        background-color: #404040;
+        color: #ffffff;
+    }
+    QMenu::item:pressed {
+        background-color: #2a2a2a;
+        color: #ffffff;
+    }
+    QMenu::separator {
+        height: 1px;
+        background-color: #404040;
+        margin: 4px 8px;
+    }
+"""
+
+# Bottom control bar and its Add / Run / Exit buttons
+CONTROLS_QSS = """
+    QWidget {
+        background-color: #2F2F2F;
+        border: none;
+        border-radius: 0px;
+    }
+    QPushButton {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 1px solid #404040;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #363636;
+        border-color: #606060;
+    }
+    QPushButton:pressed {
+        background-color: #1a1a1a;
+    }
+"""
+
+# Grey hint text under the settings dialog's choices
+DIALOG_HINT_QSS = "color: #808080; font-size: 11px;"
+
+# Options for the "pin" file dialogs. Custom folder icons make the dialog ask the shell for
+# every entry's icon (O(entries) extractions in big folders like Start Menu\Programs), and
+# ReadOnly hides rename/delete/new-folder, which a picker doesn't need. The native OS dialog
+# is kept (no DontUseNativeDialog) because it is served from the Windows shell icon cache.
+PIN_DIALOG_OPTIONS = (
+    QFileDialog.Option.DontResolveSymlinks
+    | QFileDialog.Option.DontUseCustomDirectoryIcons
+    | QFileDialog.Option.ReadOnly
+)
+
+@functools.lru_cache(maxsize=1024)
+def _resolved(path: str) -> str:
+    """Absolute, symlink-resolved form of a path (memoized; resolving stats the filesystem)."""
+    return str(Path(path).resolve())
+
+
+@functools.lru_cache(maxsize=1024)
+def _suffix(path: str) -> str:
+    """Lower-cased file extension of a path (memoized)."""
+    return Path(path).suffix.lower()
+
+
+# Canonical (sorted) size tuples, keyed by the order callers pass them in. Only a handful of
+# size lists are ever used, so icon cache keys share these tuples instead of re-sorting.
+_SIZES_INTERN: dict = {}
+
+
+def _canon_sizes(sizes: Optional[List[int]]) -> tuple:
+    """Return the interned, sorted tuple for a list of icon sizes."""
+    if sizes is None:
+        return (32,)  # Default size
+    key = tuple(sizes)
+    canon = _SIZES_INTERN.get(key)
+    if canon is None:
+        canon = _SIZES_INTERN[key] = tuple(sorted(key))
+    return canon
+
+
+# File kind by extension (anything else is a plain 'file'), shared by fallback icons and diagnostics
+_EXT_KIND = {
+    **dict.fromkeys(('.exe', '.msi', '.bat', '.cmd', '.com'), 'executable'),
+    **dict.fromkeys(('.py', '.pyw', '.js', '.vbs', '.ps1'), 'script'),
+    **dict.fromkeys(('.txt', '.doc', '.docx', '.pdf', '.rtf'), 'document'),
+    **dict.fromkeys(('.mp3', '.mp4', '.avi', '.mov', '.wav'), 'media'),
+    '.lnk': 'shortcut',
+}
+
+# Fallback style icon for each file kind
+_KIND_PIXMAP = {
+    'directory': QStyle.StandardPixmap.SP_DirIcon,
+    'executable': QStyle.StandardPixmap.SP_ComputerIcon,
+    'script': QStyle.StandardPixmap.SP_FileIcon,
+    'document': QStyle.StandardPixmap.SP_FileDialogDetailedView,
+    'media': QStyle.StandardPixmap.SP_DriveNetIcon,
+    'shortcut': QStyle.StandardPixmap.SP_FileLinkIcon,
+    'file': QStyle.StandardPixmap.SP_FileIcon,
+}
+
+
+def _file_kind(path: str) -> str:
+    """Classify a path as 'directory' or by its extension."""
+    if os.path.isdir(path):
+        return 'directory'
+    return _EXT_KIND.get(_suffix(path), 'file')
+
+
+@functools.lru_cache(maxsize=32)
+def _load_app_icon(path: str) -> QIcon:
+    """Load one of the launcher's own icon files once; the window, app and tray share it."""
+    return QIcon(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _win32():
+    """Import pywin32's win32gui on first use; returns the module, or None if unavailable."""
+    global HAS_WIN32
+    try:
+        import win32gui
+    except ImportError:
+        HAS_WIN32 = False
+        return None
+    HAS_WIN32 = True
+    return win32gui
+
+
+def _shell_execute(path: str, verb: str = "open", directory: Optional[str] = None) -> None:
+    """Launch a path in-process via ShellExecuteW (what Start-Process wraps).
     
-    # Class-level cache for icons to improve performance
-    _icon_cache = {}
-    _cache_size_limit = 100  # Maximum number of cached icons
+    Raises OSError when the shell reports a failure.
+    """
+    import ctypes
+    from ctypes import wintypes
     
-    @staticmethod
-    def _get_cache_key(file_path: str, sizes: List[int] = None) -> str:
-        """Generate a cache key for the icon request."""
-        if sizes is None:
-            sizes = [32]  # Default size
-        return f"{file_path}:{','.join(map(str, sorted(sizes)))}"
+    shell_execute = ctypes.windll.shell32.ShellExecuteW
+    shell_execute.restype = wintypes.HINSTANCE
+    SW_SHOWNORMAL = 1
+    result = shell_execute(None, verb, path, None, directory, SW_SHOWNORMAL) or 0
     
-    @staticmethod
-    def _add_to_cache(file_path: str, sizes: List[int], icon: QIcon) -> None:
-        """Add an icon to the cache."""
-        cache_key = IconExtractor._get_cache_key(file_path, sizes)
-        
-        # Implement simple LRU cache
-        if len(IconExtractor._icon_cache) >= IconExtractor._cache_size_limit:
-            # Remove oldest entry (simple approach - remove first item)
-            oldest_key = next(iter(IconExtractor._icon_cache))
-            del IconExtractor._icon_cache[oldest_key]
-        
-        IconExtractor._icon_cache[cache_key] = icon
+    # Values <= 32 are error codes; 5 for "runas" means the UAC prompt was declined
+    if result <= 32:
+        if verb == "runas" and result == 5:
+            return
+        raise OSError(f"ShellExecute failed with error code {result}")
+
+
+# Icon extraction: Windows executables and files, using multiple fallback methods.
+# These are plain module functions; IconExtractor below keeps the old class-style names.
+
+# LRU cache for icons to improve performance (most recently used at the end)
+_ICON_CACHE: "OrderedDict[tuple, QIcon]" = OrderedDict()
+_cache_size_limit = 100  # Maximum number of cached icons
+_cache_hits = 0
+_cache_misses = 0
+# Standard style icons used as fallbacks, loaded from the style on first use
+_STD_ICON_CACHE: dict = {}
+# Paths whose icon currently comes from a generic fallback instead of a real extraction
+_FALLBACK_ICON_PATHS: set = set()
+# Raw icon images extracted ahead of time by prewarm workers, keyed by (path, small icon),
+# least recently used first
+_RAW_IMAGE_CACHE: "OrderedDict[tuple, QImage]" = OrderedDict()
+_RAW_IMAGE_CACHE_LIMIT = 512  # Maximum number of raw images kept
+# Signals of the background icon loads still running, by path (also under _RAW_IMAGE_LOCK)
+_PENDING_LOADS: dict = {}
+_RAW_IMAGE_LOCK = threading.Lock()
+# Primary screen device pixel ratio, reset when the primary screen or its DPI changes
+_device_pixel_ratio: Optional[float] = None
+_dpr_watch_connected = False
+_dpr_watched_screen = None
+# One shared provider so the shell's icon lookup state is reused across calls
+_icon_provider: Optional[QFileIconProvider] = None
+# Rendered tile pixmaps persisted across runs, as <sha1(path)>_<size>_<mtime>_<dpr>_<render>.png
+_ICON_DISK_CACHE_DIR = Path(
+    os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local"))
+) / APP_NAME / "icon_cache"
+# Maximum number of files kept in the on-disk cache (one per app, size and render setting)
+_ICON_DISK_CACHE_LIMIT = 1000
+
+
+def _add_to_cache(file_path: str, sizes: List[int], icon: QIcon) -> None:
+    """Add an icon to the cache, evicting the least recently used entries."""
+    cache_key = (file_path, _canon_sizes(sizes))
+    cache = _ICON_CACHE
     
-    @staticmethod
-    def _get_from_cache(file_path: str, sizes: List[int] = None) -> Optional[QIcon]:
-        """Get an icon from the cache if available."""
-        cache_key = IconExtractor._get_cache_key(file_path, sizes)
-        return IconExtractor._icon_cache.get(cache_key)
+    if cache_key in cache:
+        cache.move_to_end(cache_key)
+    cache[cache_key] = icon
+    while len(cache) > _cache_size_limit:
+        cache.popitem(last=False)
+
+
+def _get_from_cache(file_path: str, sizes: List[int] = None) -> Optional[QIcon]:
+    """Get an icon from the cache if available, marking it as recently used."""
+    global _cache_hits, _cache_misses
+    cache_key = (file_path, _canon_sizes(sizes))
+    icon = _ICON_CACHE.get(cache_key)
+    if icon is not None:
+        _ICON_CACHE.move_to_end(cache_key)
+        _cache_hits += 1
+    else:
+        _cache_misses += 1
+    return icon
+
+
+def clear_cache() -> None:
+    """Clear the icon cache and reset its statistics."""
+    global _cache_hits, _cache_misses
+    _ICON_CACHE.clear()
+    QPixmapCache.clear()
+    with _RAW_IMAGE_LOCK:
+        _RAW_IMAGE_CACHE.clear()
+    _FALLBACK_ICON_PATHS.clear()
+    _cache_hits = 0
+    _cache_misses = 0
+
+
+def cache_info() -> dict:
+    """Return icon cache statistics, in the spirit of functools.lru_cache.cache_info()."""
+    return {
+        'hits': _cache_hits,
+        'misses': _cache_misses,
+        'maxsize': _cache_size_limit,
+        'currsize': len(_ICON_CACHE)
+    }
+
+
+def disk_cache_render_tag(settings: dict) -> str:
+    """Return the part of a disk cache file name that covers how its icon was rendered.
     
-    @staticmethod
-    def clear_cache() -> None:
-        """Clear the icon cache."""
-        IconExtractor._icon_cache.clear()
+    ``settings`` are the launcher's active icon quality settings; the tag combines the
+    screen's device pixel ratio with the settings that change the rendered pixmap.
+    """
+    render = "{}|{}|{}".format(
+        settings.get('use_dpi_aware_scaling', True),
+        settings.get('use_high_quality_scaling', True),
+        settings.get('fallback_scaling_method', 'smooth'),
+    )
+    dpr = int(round(_get_device_pixel_ratio() * 100))
+    return f"{dpr}_{hashlib.sha1(render.encode('utf-8')).hexdigest()[:8]}"
+
+
+def _disk_cache_path(file_path: str, size: int, render_tag: str) -> Optional[Path]:
+    """Return the on-disk cache file for a path's icon at a size, or None if the path is gone.
     
-    @staticmethod
-    def extract_icon(file_path: str, size: int = 32) -> QIcon:
-        """
-        Extract icon from file using best available method.
-        Falls back gracefully if advanced methods aren't available.
-        """
-        file_path = str(Path(file_path).resolve())
+    The name covers everything the rendered pixmap depends on (file version, size and the
+    ``disk_cache_render_tag()``), so a change makes old entries miss instead of being purged.
+    """
+    file_path = _resolved(file_path)
+    try:
+        mtime = int(os.stat(file_path).st_mtime)
+    except OSError:
+        return None
+    digest = hashlib.sha1(file_path.encode("utf-8")).hexdigest()
+    return _ICON_DISK_CACHE_DIR / f"{digest}_{size}_{mtime}_{render_tag}.png"
+
+
+def load_disk_cached_pixmap(file_path: str, size: int, render_tag: str) -> Optional[QPixmap]:
+    """Load a pixmap rendered by an earlier run, if the file has not changed since."""
+    cache_path = _disk_cache_path(file_path, size, render_tag)
+    if cache_path is None or not cache_path.exists():
+        return None
+    pixmap = QPixmap(str(cache_path))
+    if pixmap.isNull():
+        return None
+    # PNG does not keep the device pixel ratio; the pixmap was rendered at `size` logical pixels
+    if pixmap.width() > size:
+        pixmap.setDevicePixelRatio(pixmap.width() / size)
+    return pixmap
+
+
+def store_disk_cached_pixmap(file_path: str, size: int, pixmap: QPixmap, render_tag: str) -> None:
+    """Write a rendered pixmap through to the on-disk cache."""
+    cache_path = _disk_cache_path(file_path, size, render_tag)
+    if cache_path is None:
+        return
+    try:
+        _ICON_DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        pixmap.save(str(cache_path), "PNG")
+    except OSError as e:
+        logger.debug("Could not write icon cache file %s: %s", cache_path, e)
+
+
+def prune_disk_cache(limit: int) -> None:
+    """Delete all but the `limit` most recently written on-disk cache files."""
+    try:
+        entries = [(entry.stat().st_mtime, entry.path) for entry in os.scandir(_ICON_DISK_CACHE_DIR)
+                   if entry.name.endswith(".png")]
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[max(limit, 0):]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def extract_icon(file_path: str, size: int = 32) -> QIcon:
+    """
+    Extract icon from file using best available method.
+    Falls back gracefully if advanced methods aren't available.
+    """
+    file_path = _resolved(file_path)
+    
+    # Check cache first
+    cached_icon = _get_from_cache(file_path, [size])
+    if cached_icon:
+        return cached_icon
+    
+    # Method 1: Try win32 API (most accurate, like SuperLauncher)
+    if _win32():
+        icon = _extract_with_win32(file_path, size)
+        if icon and not icon.isNull():
+            _FALLBACK_ICON_PATHS.discard(file_path)
+            _add_to_cache(file_path, [size], icon)
+            return icon
+    
+    # Method 2: Try system icon association
+    icon = _extract_system_icon(file_path)
+    if icon and not icon.isNull():
+        _FALLBACK_ICON_PATHS.discard(file_path)
+        _add_to_cache(file_path, [size], icon)
+        return icon
+    
+    # Method 3: Default icon based on file extension
+    icon = _get_default_icon(file_path)
+    _add_to_cache(file_path, [size], icon)
+    return icon
+
+
+def extract_icon_multi_size(file_path: str, sizes: List[int] = None) -> QIcon:
+    """
+    Extract icon at multiple sizes for better scaling quality.
+    This method provides the best visual results by extracting icons
+    at multiple resolutions and letting Qt choose the best one.
+    """
+    try:
+        if sizes is None:
+            sizes = [16, 24, 32, 48, 64, 128]  # Common icon sizes
+        elif len(sizes) == 1:
+            # Nothing to combine for a single size
+            return extract_icon(file_path, sizes[0])
+        
+        file_path = _resolved(file_path)
         
         # Check cache first
-        cached_icon = IconExtractor._get_from_cache(file_path, [size])
+        cached_icon = _get_from_cache(file_path, sizes)
         if cached_icon:
             return cached_icon
         
-        # Method 1: Try win32 API (most accurate, like SuperLauncher)
-        if HAS_WIN32:
-            icon = IconExtractor._extract_with_win32(file_path, size)
-            if icon and not icon.isNull():
-                IconExtractor._add_to_cache(file_path, [size], icon)
-                return icon
+        icon = QIcon()
         
-        # Method 2: Try system icon association
-        icon = IconExtractor._extract_system_icon(file_path)
-        if icon and not icon.isNull():
-            IconExtractor._add_to_cache(file_path, [size], icon)
-            return icon
-        
-        # Method 3: Default icon based on file extension
-        icon = IconExtractor._get_default_icon(file_path)
-        IconExtractor._add_to_cache(file_path, [size], icon)
-        return icon
-    
-    @staticmethod
-    def extract_icon_multi_size(file_path: str, sizes: List[int] = None) -> QIcon:
-        """
-        Extract icon at multiple sizes for better scaling quality.
-        This method provides the best visual results by extracting icons
-        at multiple resolutions and letting Qt choose the best one.
-        """
-        try:
-            if sizes is None:
-                sizes = [16, 24, 32, 48, 64, 128]  # Common icon sizes
-            
-            file_path = str(Path(file_path).resolve())
-            
-            # Check cache first
-            cached_icon = IconExtractor._get_from_cache(file_path, sizes)
-            if cached_icon:
-                return cached_icon
-            
-            icon = QIcon()
-            
-            # Method 1: Try win32 API with multiple sizes
-            if HAS_WIN32:
-                for size in sizes:
-                    try:
-                        single_icon = IconExtractor._extract_with_win32(file_path, size)
-                        if single_icon and not single_icon.isNull():
-                            pixmap = single_icon.pixmap(size, size)
-                            if not pixmap.isNull():
-                                icon.addPixmap(pixmap)
-                    except Exception:
-                        continue
-                
-                # If we got any icons, return the multi-size icon
-                if not icon.isNull():
-                    IconExtractor._add_to_cache(file_path, sizes, icon)
-                    return icon
-            
-            # Method 2: Try system icon association (also supports multiple sizes)
-            try:
-                file_info = QFileInfo(file_path)
-                provider = QFileIconProvider()
-                system_icon = provider.icon(file_info)
-                
-                # Extract multiple sizes from system icon
-                for size in sizes:
-                    pixmap = system_icon.pixmap(size, size)
-                    if not pixmap.isNull():
-                        icon.addPixmap(pixmap)
-                
-                if not icon.isNull():
-                    IconExtractor._add_to_cache(file_path, sizes, icon)
-                    return icon
-            except Exception:
-                pass
-            
-            # Method 3: Default icon with multiple sizes
-            icon = IconExtractor._get_default_icon_multi_size(file_path, sizes)
-            IconExtractor._add_to_cache(file_path, sizes, icon)
-            return icon
-        except Exception:
-            # If multi-size extraction fails, fall back to basic method
-            return IconExtractor.extract_icon(file_path, sizes[0] if sizes else 32)
-    
-    @staticmethod
-    def _extract_with_win32(file_path: str, size: int = 32) -> Optional[QIcon]:
-        """Extract icon using win32 API (equivalent to C# Icon.ExtractAssociatedIcon)."""
-        try:
-            # Use SHGetFileInfo to get the icon (simpler and more reliable)
-            import struct
-            
-            # Define constants
-            SHGFI_ICON = 0x000000100
-            SHGFI_LARGEICON = 0x000000000
-            SHGFI_SMALLICON = 0x000000001
-            
-            # Choose icon size
-            flags = SHGFI_ICON | (SHGFI_SMALLICON if size <= 24 else SHGFI_LARGEICON)
-            
-            # Get file info structure
-            ret, info = win32gui.SHGetFileInfo(file_path, 0, flags)
-            
-            if ret and info[0]:  # info[0] is the icon handle
-                # Convert icon handle to QIcon using QPixmap.fromWinHICON if available
+        # Method 1: Try win32 API with multiple sizes
+        if _win32():
+            # SHGetFileInfo only has a small and a large icon: extract each at most once
+            # and let Qt derive every requested size from it
+            base_icons = {}
+            for size in sizes:
                 try:
-                    pixmap = QPixmap.fromWinHICON(info[0])
-                    icon = QIcon(pixmap)
-                    win32gui.DestroyIcon(info[0])  # Clean up the icon handle
-                    return icon
-                except AttributeError:
-                    # Fallback: QPixmap.fromWinHICON might not be available
-                    win32gui.DestroyIcon(info[0])
-                    
-        except Exception:
-            pass
+                    small = size <= 24
+                    if small not in base_icons:
+                        base_icons[small] = _extract_with_win32(file_path, size)
+                    single_icon = base_icons[small]
+                    if single_icon and not single_icon.isNull():
+                        pixmap = single_icon.pixmap(size, size)
+                        if not pixmap.isNull():
+                            icon.addPixmap(pixmap)
+                except Exception:
+                    continue
+            
+            # If we got any icons, return the multi-size icon
+            if not icon.isNull():
+                _FALLBACK_ICON_PATHS.discard(file_path)
+                _add_to_cache(file_path, sizes, icon)
+                return icon
         
-        return None
-    
-    @staticmethod
-    def _extract_system_icon(file_path: str) -> QIcon:
-        """Use Qt's built-in system icon extraction."""
+        # Method 2: Try system icon association (also supports multiple sizes)
         try:
-            # Try to use system file icon
             file_info = QFileInfo(file_path)
-            provider = QFileIconProvider()
-            return provider.icon(file_info)
-        except Exception:
-            return QIcon()
-    
-    @staticmethod
-    def _get_default_icon(file_path: str) -> QIcon:
-        """Get default icon based on file extension or type."""
-        try:
-            app = QApplication.instance()
-            if not app:
-                return QIcon()
-            
-            # Check if it's a directory first
-            if os.path.isdir(file_path):
-                return app.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon)
-            
-            ext = Path(file_path).suffix.lower()
-            
-            # Executable files
-            if ext in ['.exe', '.msi', '.bat', '.cmd', '.com']:
-                return app.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
-            
-            # Script files
-            elif ext in ['.py', '.pyw', '.js', '.vbs', '.ps1']:
-                return app.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon)
-            
-            # Documents
-            elif ext in ['.txt', '.doc', '.docx', '.pdf', '.rtf']:
-                return app.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView)
-            
-            # Media files
-            elif ext in ['.mp3', '.mp4', '.avi', '.mov', '.wav']:
-                return app.style().standardIcon(QStyle.StandardPixmap.SP_DriveNetIcon)
-            
-            # Folders/shortcuts
-            elif ext in ['.lnk']:
-                return app.style().standardIcon(QStyle.StandardPixmap.SP_FileLinkIcon)
-            
-            # Default file icon
-            else:
-                return app.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon)
-                
-        except Exception:
-            return QIcon()
-    
-    @staticmethod
-    def _get_default_icon_multi_size(file_path: str, sizes: List[int]) -> QIcon:
-        """Get default icon at multiple sizes for better scaling."""
-        try:
-            app = QApplication.instance()
-            if not app:
-                return QIcon()
-            
-            icon = QIcon()
+            provider = _provider()
+            system_icon = provider.icon(file_info)
             
-            # Check if it's a directory first
-            if os.path.isdir(file_path):
-                base_icon = app.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon)
-            else:
-                ext = Path(file_path).suffix.lower()
-                
-                # Executable files
-                if ext in ['.exe', '.msi', '.bat', '.cmd', '.com']:
-                    base_icon = app.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
-                
-                # Script files
-                elif ext in ['.py', '.pyw', '.js', '.vbs', '.ps1']:
-                    base_icon = app.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon)
-                
-                # Documents
-                elif ext in ['.txt', '.doc', '.docx', '.pdf', '.rtf']:
-                    base_icon = app.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView)
-                
-                # Media files
-                elif ext in ['.mp3', '.mp4', '.avi', '.mov', '.wav']:
-                    base_icon = app.style().standardIcon(QStyle.StandardPixmap.SP_DriveNetIcon)
-                
-                # Folders/shortcuts
-                elif ext in ['.lnk']:
-                    base_icon = app.style().standardIcon(QStyle.StandardPixmap.SP_FileLinkIcon)
-                
-                # Default file icon
-                else:
-                    base_icon = app.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon)
-            
-            # Add multiple sizes to the icon
+            # Extract multiple sizes from system icon
             for size in sizes:
-                pixmap = base_icon.pixmap(size, size)
+                pixmap = system_icon.pixmap(size, size)
                 if not pixmap.isNull():
                     icon.addPixmap(pixmap)
             
-            return icon
-                
+            if not icon.isNull():
+                _FALLBACK_ICON_PATHS.discard(file_path)
+                _add_to_cache(file_path, sizes, icon)
+                return icon
         except Exception:
-            return QIcon()
+            pass
+        
+        # Method 3: Default icon with multiple sizes
+        icon = _get_default_icon_multi_size(file_path, sizes)
+        _add_to_cache(file_path, sizes, icon)
+        return icon
+    except Exception:
+        # If multi-size extraction fails, fall back to basic method
+        return extract_icon(file_path, sizes[0] if sizes else 32)
 
-    @staticmethod
-    def create_high_quality_icon(base_icon: QIcon, target_size: int) -> QIcon:
-        """
-        Create a high-quality icon by scaling with better interpolation.
-        This method provides smoother scaling for icons that need to be resized.
-        """
-        if base_icon.isNull():
-            return base_icon
+
+def _extract_with_win32(file_path: str, size: int = 32) -> Optional[QIcon]:
+    """Extract icon using win32 API (equivalent to C# Icon.ExtractAssociatedIcon)."""
+    # Use the image a prewarm worker already extracted, if any
+    with _RAW_IMAGE_LOCK:
+        image = _RAW_IMAGE_CACHE.get((file_path, size <= 24))
+        if image is not None:
+            _RAW_IMAGE_CACHE.move_to_end((file_path, size <= 24))
+    
+    if image is None:
+        image = _extract_image_with_win32(file_path, size)
+    if image is None:
+        return None
+    return QIcon(QPixmap.fromImage(image))
+
+
+def _extract_image_with_win32(file_path: str, size: int = 32) -> Optional[QImage]:
+    """Extract icon as a QImage using win32 API.
+    
+    Only QImage (not QPixmap/QIcon) is created here, so this is safe to call from worker threads.
+    """
+    w = _win32()
+    if not w:
+        return None
+    
+    try:
+        # Use SHGetFileInfo to get the icon (simpler and more reliable)
+        # Define constants
+        SHGFI_ICON = 0x000000100
+        SHGFI_LARGEICON = 0x000000000
+        SHGFI_SMALLICON = 0x000000001
         
-        # Try to get the largest available size first
-        available_sizes = base_icon.availableSizes()
-        if not available_sizes:
-            return base_icon
+        # Choose icon size
+        flags = SHGFI_ICON | (SHGFI_SMALLICON if size <= 24 else SHGFI_LARGEICON)
         
-        # Find the best source size (closest to target but not smaller)
-        best_size = None
-        for size in sorted(available_sizes, key=lambda s: s.width(), reverse=True):
-            if size.width() >= target_size:
-                best_size = size
-                break
+        # Get file info structure
+        ret, info = w.SHGetFileInfo(file_path, 0, flags)
         
-        # If no larger size found, use the largest available
-        if not best_size:
-            best_size = max(available_sizes, key=lambda s: s.width())
+        if ret and info[0]:  # info[0] is the icon handle
+            try:
+                return _hicon_to_image(info[0])
+            finally:
+                w.DestroyIcon(info[0])  # Clean up the icon handle
+    
+    except Exception:
+        pass
+    
+    return None
+
+
+def _hicon_to_image(hicon) -> Optional[QImage]:
+    """Convert an icon handle to a QImage without any temp file or PNG round-trip."""
+    from_hicon = getattr(QImage, 'fromHICON', None)
+    if from_hicon is not None:
+        image = from_hicon(hicon)
+        return None if image.isNull() else image
+    return _hicon_to_image_dib(hicon)
+
+
+def _hicon_to_image_dib(hicon) -> Optional[QImage]:
+    """Read the icon's colour bitmap as 32-bit BGRA via GetIconInfo + GetDIBits."""
+    import ctypes
+    from ctypes import wintypes
+    
+    class ICONINFO(ctypes.Structure):
+        _fields_ = [("fIcon", wintypes.BOOL), ("xHotspot", wintypes.DWORD), ("yHotspot", wintypes.DWORD),
+                    ("hbmMask", wintypes.HBITMAP), ("hbmColor", wintypes.HBITMAP)]
+    
+    class BITMAP(ctypes.Structure):
+        _fields_ = [("bmType", wintypes.LONG), ("bmWidth", wintypes.LONG), ("bmHeight", wintypes.LONG),
+                    ("bmWidthBytes", wintypes.LONG), ("bmPlanes", wintypes.WORD),
+                    ("bmBitsPixel", wintypes.WORD), ("bmBits", ctypes.c_void_p)]
+    
+    class BITMAPINFOHEADER(ctypes.Structure):
+        _fields_ = [("biSize", wintypes.DWORD), ("biWidth", wintypes.LONG), ("biHeight", wintypes.LONG),
+                    ("biPlanes", wintypes.WORD), ("biBitCount", wintypes.WORD),
+                    ("biCompression", wintypes.DWORD), ("biSizeImage", wintypes.DWORD),
+                    ("biXPelsPerMeter", wintypes.LONG), ("biYPelsPerMeter", wintypes.LONG),
+                    ("biClrUsed", wintypes.DWORD), ("biClrImportant", wintypes.DWORD)]
+    
+    user32 = ctypes.windll.user32
+    gdi32 = ctypes.windll.gdi32
+    
+    info = ICONINFO()
+    if not user32.GetIconInfo(wintypes.HICON(int(hicon)), ctypes.byref(info)):
+        return None
+    try:
+        if not info.hbmColor:
+            return None  # Monochrome icon, no colour bitmap to read
+        
+        bitmap = BITMAP()
+        gdi32.GetObjectW(info.hbmColor, ctypes.sizeof(bitmap), ctypes.byref(bitmap))
+        width, height = bitmap.bmWidth, bitmap.bmHeight
+        
+        header = BITMAPINFOHEADER()
+        header.biSize = ctypes.sizeof(header)
+        header.biWidth = width
+        header.biHeight = -height  # Negative height gives top-down rows, as QImage expects
+        header.biPlanes = 1
+        header.biBitCount = 32
+        header.biCompression = 0  # BI_RGB
+        
+        buffer = ctypes.create_string_buffer(width * height * 4)
+        hdc = user32.GetDC(None)
+        try:
+            rows = gdi32.GetDIBits(hdc, info.hbmColor, 0, height, buffer, ctypes.byref(header), 0)  # DIB_RGB_COLORS
+        finally:
+            user32.ReleaseDC(None, hdc)
+        if rows != height:
+            return None
         
-        # Extract the pixmap at the best size
-        source_pixmap = base_icon.pixmap(best_size)
-        if source_pixmap.isNull():
-            return base_icon
+        data = buffer.raw
+        # Legacy icons without an alpha channel would otherwise come out fully transparent
+        image_format = QImage.Format.Format_ARGB32 if any(data[3::4]) else QImage.Format.Format_RGB32
+        # copy() detaches the image from the Python bytes it was built on
+        return QImage(data, width, height, width * 4, image_format).copy()
+    finally:
+        if info.hbmColor:
+            gdi32.DeleteObject(info.hbmColor)
+        if info.hbmMask:
+            gdi32.DeleteObject(info.hbmMask)
+
+
+def _has_raw_image(file_path: str, small: bool) -> bool:
+    """Whether the raw win32 image for a path and icon size has already been extracted."""
+    with _RAW_IMAGE_LOCK:
+        return (_resolved(file_path), small) in _RAW_IMAGE_CACHE
+
+
+def prewarm(paths: List[str], sizes: List[int]) -> None:
+    """Extract raw icons for paths on the global thread pool ahead of building widgets."""
+    # Nothing to load (e.g. every tile is cached on disk): don't import pywin32 at all
+    if not paths or not _win32():
+        return
+    
+    # SHGetFileInfo only has a small and a large icon, so those are all we need to fetch
+    small_flags = tuple({size <= 24 for size in sizes})
+    for path in paths:
+        _start_icon_load(path, small_flags)
+
+
+def _start_icon_load(path: str, small_flags: tuple, on_done=None) -> None:
+    """Start a background raw icon load for a path, or join the one already running.
+    
+    ``on_done(path)`` is called on the GUI thread once the raw images are cached. It is
+    connected while the lock is held, so a load that is finishing cannot emit before it.
+    """
+    with _RAW_IMAGE_LOCK:
+        signals = _PENDING_LOADS.get(path)
+        if signals is None:
+            loader = _IconLoader(path, small_flags)
+            signals = _PENDING_LOADS[path] = loader.signals
+            if on_done is not None:
+                signals.done.connect(on_done)
+            QThreadPool.globalInstance().start(loader)
+        elif on_done is not None:
+            signals.done.connect(on_done)
+
+
+def _provider() -> QFileIconProvider:
+    """Return the shared QFileIconProvider, created on first use (after QApplication exists)."""
+    global _icon_provider
+    if _icon_provider is None:
+        _icon_provider = QFileIconProvider()
+    return _icon_provider
+
+
+def _extract_system_icon(file_path: str) -> QIcon:
+    """Use Qt's built-in system icon extraction."""
+    try:
+        # Try to use system file icon
+        file_info = QFileInfo(file_path)
+        provider = _provider()
+        return provider.icon(file_info)
+    except Exception:
+        return QIcon()
+
+
+def _std(standard_pixmap: QStyle.StandardPixmap) -> QIcon:
+    """Return a standard style icon, asking the style for it only once."""
+    icon = _STD_ICON_CACHE.get(standard_pixmap)
+    if icon is None:
+        app = QApplication.instance()
+        if not app:
+            return QIcon()
+        icon = _STD_ICON_CACHE[standard_pixmap] = app.style().standardIcon(standard_pixmap)
+    return icon
+
+
+def is_fallback_icon(file_path: str) -> bool:
+    """Whether a path's icon last came from a generic default instead of the file itself."""
+    return _resolved(file_path) in _FALLBACK_ICON_PATHS
+
+
+def _get_default_icon(file_path: str) -> QIcon:
+    """Get default icon based on file extension or type."""
+    _FALLBACK_ICON_PATHS.add(_resolved(file_path))
+    try:
+        return _std(_KIND_PIXMAP[_file_kind(file_path)])
+    except Exception:
+        return QIcon()
+
+
+def _get_default_icon_multi_size(file_path: str, sizes: List[int]) -> QIcon:
+    """Get default icon at multiple sizes for better scaling."""
+    try:
+        icon = QIcon()
+        base_icon = _get_default_icon(file_path)
         
-        # Create a new icon with the scaled pixmap
-        scaled_icon = QIcon()
+        # Add multiple sizes to the icon
+        for size in sizes:
+            pixmap = base_icon.pixmap(size, size)
+            if not pixmap.isNull():
+                icon.addPixmap(pixmap)
         
-        # Add the target size with high-quality scaling
-        if best_size.width() == target_size:
-            # No scaling needed
-            scaled_icon.addPixmap(source_pixmap)
+        return icon
+    
+    except Exception:
+        return QIcon()
+
+
+def create_high_quality_icon(base_icon: QIcon, target_size: int) -> QIcon:
+    """
+    Create a high-quality icon by scaling with better interpolation.
+    This method provides smoother scaling for icons that need to be resized.
+    """
+    if base_icon.isNull():
+        return base_icon
+    
+    available_sizes = base_icon.availableSizes()
+    if not available_sizes:
+        return base_icon
+    
+    sizes_by_width = {size.width(): size for size in available_sizes}
+    # The icon already has the target size, nothing to scale
+    if target_size in sizes_by_width:
+        return base_icon
+    
+    # Find the best source size (smallest not below target), else the largest available
+    best_width = min((w for w in sizes_by_width if w >= target_size), default=max(sizes_by_width))
+    best_size = sizes_by_width[best_width]
+    
+    # Extract the pixmap at the best size
+    source_pixmap = base_icon.pixmap(best_size)
+    if source_pixmap.isNull():
+        return base_icon
+    
+    # Create a new icon with the scaled pixmap
+    scaled_icon = QIcon()
+    
+    # Add the target size with high-quality scaling
+    scaled_pixmap = source_pixmap.scaled(
+        target_size, target_size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+    scaled_icon.addPixmap(scaled_pixmap)
+    
+    return scaled_icon
+
+
+def create_dpi_aware_icon(base_icon: QIcon, target_size: int, device_pixel_ratio: float = 1.0) -> QIcon:
+    """
+    Create a DPI-aware icon that looks crisp on high-DPI displays.
+    This method accounts for the device pixel ratio to ensure icons
+    are rendered at the appropriate resolution.
+    """
+    if base_icon.isNull():
+        return base_icon
+    
+    # Calculate the actual pixel size needed for the target logical size
+    actual_pixel_size = int(target_size * device_pixel_ratio)
+    
+    # Get available sizes
+    available_sizes = base_icon.availableSizes()
+    if not available_sizes:
+        return base_icon
+    
+    sizes_by_width = {size.width(): size for size in available_sizes}
+    # The icon already has the needed pixel size, nothing to scale
+    if actual_pixel_size in sizes_by_width:
+        return base_icon
+    
+    # Find the best source size (smallest not below target), else the largest available
+    best_width = min((w for w in sizes_by_width if w >= actual_pixel_size), default=max(sizes_by_width))
+    best_size = sizes_by_width[best_width]
+    
+    # Extract the pixmap at the best size
+    source_pixmap = base_icon.pixmap(best_size)
+    if source_pixmap.isNull():
+        return base_icon
+    
+    # Create a new icon
+    dpi_icon = QIcon()
+    
+    # Scale to the actual pixel size with high quality
+    scaled_pixmap = source_pixmap.scaled(
+        actual_pixel_size, actual_pixel_size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+    dpi_icon.addPixmap(scaled_pixmap)
+    
+    return dpi_icon
+
+
+def get_icon_quality_settings() -> dict:
+    """
+    Get the current icon quality settings.
+    Returns a dictionary with quality configuration options.
+    """
+    return {
+        'use_high_quality_scaling': True,
+        'use_dpi_aware_scaling': True,
+        'preferred_source_sizes': [32, 48, 64, 128],
+        'fallback_scaling_method': 'smooth',  # 'smooth', 'fast', 'best'
+        'cache_enabled': True,
+        'cache_size_limit': 100
+    }
+
+
+def set_icon_quality_settings(settings: dict) -> None:
+    """
+    Update icon quality settings.
+    This allows users to customize the icon scaling behavior.
+    """
+    global _cache_size_limit
+    if 'cache_size_limit' in settings:
+        _cache_size_limit = settings['cache_size_limit']
+    
+    if 'cache_enabled' in settings and not settings['cache_enabled']:
+        clear_cache()
+
+
+def _get_device_pixel_ratio() -> float:
+    """Return the primary screen's device pixel ratio, looked up once per screen change."""
+    global _device_pixel_ratio, _dpr_watch_connected, _dpr_watched_screen
+    if _device_pixel_ratio is None:
+        screen = QApplication.primaryScreen()
+        if not screen:
+            return 1.0
+        _device_pixel_ratio = screen.devicePixelRatio()
+        
+        def reset(*_):
+            global _device_pixel_ratio
+            _device_pixel_ratio = None
+        # Watch the screen the ratio came from; a new primary screen is watched once it is queried
+        if not _dpr_watch_connected:
+            QApplication.instance().primaryScreenChanged.connect(reset)
+            _dpr_watch_connected = True
+        if screen is not _dpr_watched_screen:
+            screen.logicalDotsPerInchChanged.connect(reset)
+            _dpr_watched_screen = screen
+    return _device_pixel_ratio
+
+
+def extract_icon_with_quality(file_path: str, target_size: int, quality_settings: dict = None) -> QIcon:
+    """
+    Extract icon with customizable quality settings.
+    This is the main method that users should call for best results.
+    """
+    try:
+        device_pixel_ratio = _get_device_pixel_ratio()
+        
+        if quality_settings is None:
+            quality_settings = get_icon_quality_settings()
+            # Only request the pixel size that will actually be drawn
+            actual_pixel_size = int(target_size * device_pixel_ratio)
+            base_icon = extract_icon(file_path, actual_pixel_size)
+            # Common case: the extracted icon already has exactly that size, nothing to rescale
+            if any(size.width() == actual_pixel_size for size in base_icon.availableSizes()):
+                return base_icon
         else:
-            # Scale with high quality
-            scaled_pixmap = source_pixmap.scaled(
-                target_size, target_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
+            # Extract base icon with multiple sizes
+            base_icon = extract_icon_multi_size(
+                file_path,
+                quality_settings.get('preferred_source_sizes', [32, 48, 64, 128])
             )
-            scaled_icon.addPixmap(scaled_pixmap)
         
-        # Also add the original sizes for better quality
-        for size in available_sizes:
-            if size.width() != target_size:
-                pixmap = base_icon.pixmap(size)
-                if not pixmap.isNull():
-                    scaled_icon.addPixmap(pixmap)
-        
-        return scaled_icon
-    
-    @staticmethod
-    def create_dpi_aware_icon(base_icon: QIcon, target_size: int, device_pixel_ratio: float = 1.0) -> QIcon:
-        """
-        Create a DPI-aware icon that looks crisp on high-DPI displays.
-        This method accounts for the device pixel ratio to ensure icons
-        are rendered at the appropriate resolution.
-        """
         if base_icon.isNull():
             return base_icon
         
-        # Calculate the actual pixel size needed for the target logical size
-        actual_pixel_size = int(target_size * device_pixel_ratio)
-        
-        # Get available sizes
-        available_sizes = base_icon.availableSizes()
-        if not available_sizes:
-            return base_icon
-        
-        # Find the best source size for the actual pixel size
-        best_size = None
-        for size in sorted(available_sizes, key=lambda s: s.width(), reverse=True):
-            if size.width() >= actual_pixel_size:
-                best_size = size
-                break
-        
-        # If no larger size found, use the largest available
-        if not best_size:
-            best_size = max(available_sizes, key=lambda s: s.width())
-        
-        # Extract the pixmap at the best size
-        source_pixmap = base_icon.pixmap(best_size)
-        if source_pixmap.isNull():
-            return base_icon
-        
-        # Create a new icon
-        dpi_icon = QIcon()
-        
-        # Add the target logical size
-        if best_size.width() == actual_pixel_size:
-            # No scaling needed, but we need to set the device pixel ratio
-            dpi_icon.addPixmap(source_pixmap)
+        # Apply quality settings
+        if quality_settings.get('use_dpi_aware_scaling', True):
+            return create_dpi_aware_icon(base_icon, target_size, device_pixel_ratio)
+        elif quality_settings.get('use_high_quality_scaling', True):
+            return create_high_quality_icon(base_icon, target_size)
         else:
-            # Scale to the actual pixel size with high quality
-            scaled_pixmap = source_pixmap.scaled(
-                actual_pixel_size, actual_pixel_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            dpi_icon.addPixmap(scaled_pixmap)
-        
-        # Add other available sizes for fallback
-        for size in available_sizes:
-            if size.width() != actual_pixel_size:
-                pixmap = base_icon.pixmap(size)
-                if not pixmap.isNull():
-                    dpi_icon.addPixmap(pixmap)
-        
-        return dpi_icon
-    
-    @staticmethod
-    def get_icon_quality_settings() -> dict:
-        """
-        Get the current icon quality settings.
-        Returns a dictionary with quality configuration options.
-        """
-        return {
-            'use_high_quality_scaling': True,
-            'use_dpi_aware_scaling': True,
-            'preferred_source_sizes': [32, 48, 64, 128],
-            'fallback_scaling_method': 'smooth',  # 'smooth', 'fast', 'best'
-            'cache_enabled': True,
-            'cache_size_limit': 100
-        }
+            # Return base icon without additional processing
+            return base_icon
+    except Exception:
+        # If quality extraction fails, fall back to basic method
+        return extract_icon(file_path, target_size)
+
+
+def get_icon_diagnostics(file_path: str) -> dict:
+    """
+    Get diagnostic information about icon extraction for a file.
+    This helps users understand what's happening with their icons.
+    """
+    # Only needed when the diagnostics dialog is opened
+    import icon_diagnostics
+    return icon_diagnostics.get_icon_diagnostics(file_path, sys.modules[__name__])
+
+
+class IconExtractor:
+    """Backward-compatible namespace for the module-level icon extraction functions."""
     
-    @staticmethod
-    def set_icon_quality_settings(settings: dict) -> None:
-        """
-        Update icon quality settings.
-        This allows users to customize the icon scaling behavior.
-        """
-        if 'cache_size_limit' in settings:
-            IconExtractor._cache_size_limit = settings['cache_size_limit']
+    _add_to_cache = staticmethod(_add_to_cache)
+    _get_from_cache = staticmethod(_get_from_cache)
+    clear_cache = staticmethod(clear_cache)
+    cache_info = staticmethod(cache_info)
+    extract_icon = staticmethod(extract_icon)
+    extract_icon_multi_size = staticmethod(extract_icon_multi_size)
+    _extract_with_win32 = staticmethod(_extract_with_win32)
+    _extract_image_with_win32 = staticmethod(_extract_image_with_win32)
+    _hicon_to_image = staticmethod(_hicon_to_image)
+    _hicon_to_image_dib = staticmethod(_hicon_to_image_dib)
+    prewarm = staticmethod(prewarm)
+    _provider = staticmethod(_provider)
+    _extract_system_icon = staticmethod(_extract_system_icon)
+    _std = staticmethod(_std)
+    _get_default_icon = staticmethod(_get_default_icon)
+    _get_default_icon_multi_size = staticmethod(_get_default_icon_multi_size)
+    create_high_quality_icon = staticmethod(create_high_quality_icon)
+    create_dpi_aware_icon = staticmethod(create_dpi_aware_icon)
+    get_icon_quality_settings = staticmethod(get_icon_quality_settings)
+    set_icon_quality_settings = staticmethod(set_icon_quality_settings)
+    _get_device_pixel_ratio = staticmethod(_get_device_pixel_ratio)
+    extract_icon_with_quality = staticmethod(extract_icon_with_quality)
+    get_icon_diagnostics = staticmethod(get_icon_diagnostics)
+
+
+class _IconPrewarmRunnable(QRunnable):
+    """Extract the raw win32 icon images for one path on a pool thread."""
+
+    def __init__(self, path: str, small_flags: tuple) -> None:
+        super().__init__()
+        self._path = path
+        self._small_flags = small_flags
+
+    def run(self) -> None:
+        import ctypes
         
-        if 'cache_enabled' in settings and not settings['cache_enabled']:
-            IconExtractor.clear_cache()
-    
-    @staticmethod
-    def extract_icon_with_quality(file_path: str, target_size: int, quality_settings: dict = None) -> QIcon:
-        """
-        Extract icon with customizable quality settings.
-        This is the main method that users should call for best results.
-        """
+        # The shell icon lookup needs COM on the calling thread
+        ole32 = ctypes.windll.ole32
+        initialized = ole32.CoInitializeEx(None, 0x2) >= 0  # COINIT_APARTMENTTHREADED
         try:
-            if quality_settings is None:
-                quality_settings = IconExtractor.get_icon_quality_settings()
-            
-            # Extract base icon with multiple sizes
-            base_icon = IconExtractor.extract_icon_multi_size(
-                file_path, 
-                quality_settings.get('preferred_source_sizes', [32, 48, 64, 128])
-            )
-            
-            if base_icon.isNull():
-                return base_icon
-            
-            # Apply quality settings
-            if quality_settings.get('use_dpi_aware_scaling', True):
-                # Get device pixel ratio
-                device_pixel_ratio = 1.0
-                try:
-                    screen = QApplication.primaryScreen()
-                    if screen:
-                        device_pixel_ratio = screen.devicePixelRatio()
-                except Exception:
-                    pass
-                
-                return IconExtractor.create_dpi_aware_icon(base_icon, target_size, device_pixel_ratio)
-            elif quality_settings.get('use_high_quality_scaling', True):
-                return IconExtractor.create_high_quality_icon(base_icon, target_size)
-            else:
-                # Return base icon without additional processing
-                return base_icon
-        except Exception:
-            # If quality extraction fails, fall back to basic method
-            return IconExtractor.extract_icon(file_path, target_size)
+            file_path = _resolved(self._path)
+            for small in self._small_flags:
+                key = (file_path, small)
+                with _RAW_IMAGE_LOCK:
+                    if key in _RAW_IMAGE_CACHE:
+                        continue
+                image = _extract_image_with_win32(file_path, 16 if small else 32)
+                if image is not None:
+                    with _RAW_IMAGE_LOCK:
+                        _RAW_IMAGE_CACHE[key] = image
+                        while len(_RAW_IMAGE_CACHE) > _RAW_IMAGE_CACHE_LIMIT:
+                            _RAW_IMAGE_CACHE.popitem(last=False)
+        except Exception as e:
+            logger.debug("Icon prewarm failed for %s: %s", self._path, e)
+        finally:
+            if initialized:
+                ole32.CoUninitialize()
 
-    @staticmethod
-    def get_icon_diagnostics(file_path: str) -> dict:
-        """
-        Get diagnostic information about icon extraction for a file.
-        This helps users understand what's happening with their icons.
-        """
-        diagnostics = {
-            'file_path': file_path,
-            'file_exists': False,
-            'file_type': 'unknown',
-            'extraction_methods': [],
-            'available_sizes': [],
-            'errors': [],
-            'recommendations': []
-        }
-        
+
+class _DiskCacheScanSignals(QObject):
+    """Signals of _DiskCacheScanRunnable (QRunnable is not a QObject)."""
+    done = Signal(list)
+
+
+class _DiskCacheScanRunnable(QRunnable):
+    """Prune the on-disk icon cache and find the paths it has no tile pixmap for.
+    
+    Both stat the filesystem once per file, so they run on a pool thread at startup;
+    the missing paths are reported back to the GUI thread for prewarming.
+    """
+
+    def __init__(self, paths: List[str], size: int, render_tag: Optional[str]) -> None:
+        super().__init__()
+        self._paths = paths
+        self._size = size
+        # None when the disk cache is disabled: every path counts as missing
+        self._render_tag = render_tag
+        self.signals = _DiskCacheScanSignals()
+
+    def run(self) -> None:
+        missing = list(self._paths)
         try:
-            file_path = str(Path(file_path).resolve())
-            diagnostics['file_path'] = file_path
-            diagnostics['file_exists'] = os.path.exists(file_path)
-            
-            if not diagnostics['file_exists']:
-                diagnostics['errors'].append("File does not exist")
-                return diagnostics
-            
-            # Determine file type
-            if os.path.isdir(file_path):
-                diagnostics['file_type'] = 'directory'
-            else:
-                ext = Path(file_path).suffix.lower()
-                if ext in ['.exe', '.msi', '.bat', '.cmd', '.com']:
-                    diagnostics['file_type'] = 'executable'
-                elif ext in ['.py', '.pyw', '.js', '.vbs', '.ps1']:
-                    diagnostics['file_type'] = 'script'
-                elif ext in ['.txt', '.doc', '.docx', '.pdf', '.rtf']:
-                    diagnostics['file_type'] = 'document'
-                elif ext in ['.mp3', '.mp4', '.avi', '.mov', '.wav']:
-                    diagnostics['file_type'] = 'media'
-                elif ext in ['.lnk']:
-                    diagnostics['file_type'] = 'shortcut'
-                else:
-                    diagnostics['file_type'] = 'file'
-            
-            # Test different extraction methods
-            if HAS_WIN32:
-                try:
-                    win32_icon = IconExtractor._extract_with_win32(file_path, 32)
-                    if win32_icon and not win32_icon.isNull():
-                        diagnostics['extraction_methods'].append('win32_api')
-                        diagnostics['available_sizes'].extend([s.width() for s in win32_icon.availableSizes()])
-                    else:
-                        diagnostics['errors'].append("Win32 API extraction failed")
-                except Exception as e:
-                    diagnostics['errors'].append(f"Win32 API error: {str(e)}")
-            else:
-                diagnostics['recommendations'].append("Install pywin32 for better icon extraction")
-            
-            # Test system icon extraction
-            try:
-                system_icon = IconExtractor._extract_system_icon(file_path)
-                if system_icon and not system_icon.isNull():
-                    diagnostics['extraction_methods'].append('system_icon')
-                    diagnostics['available_sizes'].extend([s.width() for s in system_icon.availableSizes()])
-                else:
-                    diagnostics['errors'].append("System icon extraction failed")
-            except Exception as e:
-                diagnostics['errors'].append(f"System icon error: {str(e)}")
-            
-            # Test default icon
-            try:
-                default_icon = IconExtractor._get_default_icon(file_path)
-                if default_icon and not default_icon.isNull():
-                    diagnostics['extraction_methods'].append('default_icon')
-                    diagnostics['available_sizes'].extend([s.width() for s in default_icon.availableSizes()])
-                else:
-                    diagnostics['errors'].append("Default icon extraction failed")
-            except Exception as e:
-                diagnostics['errors'].append(f"Default icon error: {str(e)}")
-            
-            # Remove duplicates and sort sizes
-            diagnostics['available_sizes'] = sorted(list(set(diagnostics['available_sizes'])))
-            
-            # Generate recommendations
-            if not diagnostics['extraction_methods']:
-                diagnostics['recommendations'].append("No icon extraction methods succeeded")
-            elif len(diagnostics['extraction_methods']) == 1:
-                diagnostics['recommendations'].append("Only one extraction method working - consider fallbacks")
-            
-            if not diagnostics['available_sizes']:
-                diagnostics['recommendations'].append("No icon sizes available - check file format")
-            elif max(diagnostics['available_sizes']) < 48:
-                diagnostics['recommendations'].append("Icons may appear small - enable high-quality scaling")
-            
-            if diagnostics['file_type'] == 'executable' and 'win32_api' not in diagnostics['extraction_methods']:
-                diagnostics['recommendations'].append("For executables, install pywin32 for best results")
-            
+            prune_disk_cache(_ICON_DISK_CACHE_LIMIT)
+            if self._render_tag is not None:
+                missing = []
+                for path in self._paths:
+                    cache_path = _disk_cache_path(path, self._size, self._render_tag)
+                    if cache_path is None or not cache_path.exists():
+                        missing.append(path)
         except Exception as e:
-            diagnostics['errors'].append(f"General error: {str(e)}")
-        
-        return diagnostics
+            logger.debug("Icon disk cache scan failed: %s", e)
+        self.signals.done.emit(missing)
+
+
+class _IconLoaderSignals(QObject):
+    """Signals of _IconLoader (QRunnable is not a QObject)."""
+    done = Signal(str)
+
+
+class _IconLoader(_IconPrewarmRunnable):
+    """Prewarm one path's raw icon images, then report the path back to the GUI thread.
+    
+    Only the path is sent; the receiver builds its QPixmap from the now cached QImage,
+    since pixmaps may only be created on the GUI thread.
+    """
+
+    def __init__(self, path: str, small_flags: tuple) -> None:
+        super().__init__(path, small_flags)
+        self.signals = _IconLoaderSignals()
+
+    def run(self) -> None:
+        super().run()
+        # Unregister under the lock before emitting: callers connect under the same lock,
+        # so whoever found this load registered is connected before the emit below
+        with _RAW_IMAGE_LOCK:
+            _PENDING_LOADS.pop(self._path, None)
+        self.signals.done.emit(self._path)
 
 
 @dataclass
 class AppItem:
     path: str
     title: Optional[str] = None
+    # Resolved once when the item is created so menus and launches don't stat the path again
+    is_dir: bool = field(init=False, compare=False)
+    # Name derived from the path, built on first use (the title, when set, takes precedence)
+    _default_name: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.is_dir = os.path.isdir(self.path)
 
     def display_name(self) -> str:
         if self.title and self.title.strip():
             return self.title
         
-        # Check if it's a directory
-        if os.path.isdir(self.path):
-            return Path(self.path).name  # Use name() for folders to keep the full folder name
-        
-        return Path(self.path).stem
+        if self._default_name is None:
+            # Check if it's a directory
+            if self.is_dir:
+                self._default_name = Path(self.path).name  # Use name() for folders to keep the full folder name
+            else:
+                self._default_name = Path(self.path).stem
+        return self._default_name
 
 
 class ConfigStore:
@@ -619,34 +1028,66 @@ class ConfigStore:
         self.dir = config_root / APP_NAME
         self.dir.mkdir(parents=True, exist_ok=True)
         self.path = self.dir / "config.json"
+        # (st_mtime_ns, parsed data) of the config file as last read or written
+        self._cache = None
+        # App list saves run on a pool thread while settings and window position are
+        # saved on the GUI thread; every read-modify-write of the file and the cache
+        # holds this lock (re-entrant, since public methods nest _read/_write)
+        self._lock = threading.RLock()
         
         if not self.path.exists():
             self._write({"apps": []})
 
     def _read(self) -> dict:
-        try:
-            with self.path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {"apps": []}
+        """Return the parsed config, re-parsing only when the file changed on disk.
+        
+        The returned dict is shared with the cache, so callers that modify it must _write() it
+        while still holding self._lock.
+        """
+        with self._lock:
+            try:
+                mtime = self.path.stat().st_mtime_ns
+                cache = self._cache
+                if cache is not None and cache[0] == mtime:
+                    return cache[1]
+                
+                raw = self.path.read_bytes()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                self._cache = (mtime, data)
+                return data
+            except Exception:
+                return {"apps": []}
 
     def _write(self, data: dict) -> None:
-        with self.path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with self._lock:
+            if orjson:
+                self.path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with self.path.open("w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+            self._cache = (self.path.stat().st_mtime_ns, data)
 
     def load_apps(self) -> List[AppItem]:
-        data = self._read()
+        with self._lock:
+            items = list(self._read().get("apps", []))
         apps = []
-        for item in data.get("apps", []):
+        for item in items:
             path = item.get("path")
             title = item.get("title")
             if path:
                 apps.append(AppItem(path=path, title=title))
         return apps
 
+    @staticmethod
+    def app_entries(apps: List[AppItem]) -> List[dict]:
+        """Return the saved form of an app list, detached from the live AppItems."""
+        return [{"path": a.path, "title": a.title} for a in apps]
+
     def save_apps(self, apps: List[AppItem]) -> None:
-        data = {"apps": [{"path": a.path, "title": a.title} for a in apps]}
-        self._write(data)
+        self.save_app_entries(self.app_entries(apps))
+
+    def save_app_entries(self, entries: List[dict]) -> None:
+        self._write({"apps": entries})
     
     def load_icon_quality_settings(self) -> dict:
         """Load icon quality settings from config file."""
@@ -661,7 +1102,6 @@ class ConfigStore:
                 pass
         
         # Fallback to AppData config
-        data = self._read()
         default_settings = {
             'use_high_quality_scaling': True,
             'use_dpi_aware_scaling': True,
@@ -675,19 +1115,23 @@ class ConfigStore:
             'show_names': True  # Default to showing program names
         }
         
-        # If no icon quality settings exist, save the defaults
-        if 'icon_quality_settings' not in data:
-            data['icon_quality_settings'] = default_settings
-            self._write(data)
-        
-        return data.get('icon_quality_settings', default_settings)
+        with self._lock:
+            data = self._read()
+            # If no icon quality settings exist, save the defaults
+            if 'icon_quality_settings' not in data:
+                data['icon_quality_settings'] = default_settings
+                self._write(data)
+            
+            # Copy out of the cached config so callers can't change it by editing the result
+            return copy.deepcopy(data.get('icon_quality_settings', default_settings))
     
     def save_icon_quality_settings(self, settings: dict) -> None:
         """Save icon quality settings to config file."""
         # Save to AppData config
-        data = self._read()
-        data['icon_quality_settings'] = settings
-        self._write(data)
+        with self._lock:
+            data = self._read()
+            data['icon_quality_settings'] = copy.deepcopy(settings)
+            self._write(data)
         
         # Also update launcher_config.json if it exists
         if self.launcher_config_path.exists():
@@ -706,26 +1150,123 @@ class ConfigStore:
     
     def load_window_position(self) -> dict:
         """Load window position and size from config file."""
-        data = self._read()
         default_position = {
             'x': None,  # None means center on screen
             'y': None,
             'width': 620,
             'height': 620
         }
-        saved_position = data.get('window_position', default_position)
+        with self._lock:
+            saved_position = dict(self._read().get('window_position', default_position))
         return saved_position
     
     def save_window_position(self, x: int, y: int, width: int, height: int) -> None:
         """Save window position and size to config file."""
-        data = self._read()
-        data['window_position'] = {
-            'x': x,
-            'y': y,
-            'width': width,
-            'height': height
-        }
-        self._write(data)
+        with self._lock:
+            data = self._read()
+            data['window_position'] = {
+                'x': x,
+                'y': y,
+                'width': width,
+                'height': height
+            }
+            self._write(data)
+
+
+class _SaveRunnable(QRunnable):
+    """Write a snapshot of the app list on a worker thread so slow disks don't block the UI.
+    
+    Saves run on a single-thread pool, so snapshots are written in the order they were
+    taken; ConfigStore's lock keeps them from overlapping the GUI thread's config writes.
+    """
+
+    def __init__(self, config: ConfigStore, entries: List[dict]) -> None:
+        super().__init__()
+        self._config = config
+        self._entries = entries
+
+    def run(self) -> None:
+        try:
+            self._config.save_app_entries(self._entries)
+        except Exception as e:
+            logger.error("Failed to save apps: %s", e)
+
+
+class AppTile(QWidget):
+    """A grid tile that paints its app's icon and name itself.
+    
+    One widget per tile instead of a layout with an icon QLabel and a name QLabel;
+    the background, border and highlight states still come from the grid's
+    QWidget#AppTile stylesheet rules.
+    """
+    
+    _MARGIN = 5
+    _SPACING = 8
+    _TEXT_PADDING = 2
+    _TEXT_FLAGS = Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap
+    _TEXT_COLOR = QColor("#ffffff")
+
+    def __init__(self, show_text: bool = True, parent=None):
+        super().__init__(parent)
+        self.setObjectName("AppTile")
+        # Let the stylesheet paint the background of this QWidget subclass
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        font = self.font()
+        font.setPixelSize(11)
+        self.setFont(font)
+        self._pixmap: Optional[QPixmap] = None
+        self._text = ""
+        self._show_text = show_text
+        # Height of the wrapped name, measured on first paint after a text or size change
+        self._text_height: Optional[int] = None
+
+    def text(self) -> str:
+        return self._text
+
+    def setText(self, text: str) -> None:
+        self._text = text
+        self._text_height = None
+        self.update()
+
+    def setPixmap(self, pixmap: Optional[QPixmap]) -> None:
+        self._pixmap = pixmap
+        self.update()
+
+    def resizeEvent(self, event):
+        self._text_height = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        """Paint the icon and the name below it, centred together like the old label layout."""
+        rect = self.rect().adjusted(self._MARGIN, self._MARGIN, -self._MARGIN, -self._MARGIN)
+        painter = QPainter(self)
+        
+        icon_width = icon_height = 0
+        if self._pixmap is not None and not self._pixmap.isNull():
+            icon_size = self._pixmap.deviceIndependentSize().toSize()
+            icon_width, icon_height = icon_size.width(), icon_size.height()
+        
+        text_height = 0
+        if self._show_text and self._text:
+            if self._text_height is None:
+                bounds = painter.fontMetrics().boundingRect(
+                    0, 0, rect.width() - 2 * self._TEXT_PADDING, rect.height(), self._TEXT_FLAGS, self._text
+                )
+                self._text_height = bounds.height() + 2 * self._TEXT_PADDING
+            text_height = self._text_height
+        
+        spacing = self._SPACING if icon_height and text_height else 0
+        top = rect.top() + max(0, (rect.height() - icon_height - spacing - text_height) // 2)
+        if icon_height:
+            painter.drawPixmap(rect.left() + (rect.width() - icon_width) // 2, top, self._pixmap)
+        if text_height:
+            text_top = top + icon_height + spacing + self._TEXT_PADDING
+            painter.setPen(self._TEXT_COLOR)
+            painter.drawText(
+                QRect(rect.left() + self._TEXT_PADDING, text_top,
+                      rect.width() - 2 * self._TEXT_PADDING, rect.bottom() - text_top),
+                self._TEXT_FLAGS, self._text
+            )
 
 
 class AppGrid(QWidget):
@@ -735,6 +1276,42 @@ class AppGrid(QWidget):
         super().__init__(parent)
         self.apps: List[AppItem] = []
         self.app_widgets: List[QWidget] = []
+        # The launcher window, cached by _find_main_window() once the grid is placed in it
+        self._main_window = None
+        # Tile and (x, y) press position of a possible drag, set on left mouse press
+        self._drag_start_widget: Optional[QWidget] = None
+        self._drag_start_pos = None
+        # Item context menus, built on the first right-click
+        self._folder_menu: Optional[QMenu] = None
+        self._file_menu: Optional[QMenu] = None
+        # Hidden tiles kept for reuse instead of being destroyed and recreated
+        self._free_widgets: List[QWidget] = []
+        # Settings that shape a tile; when they change every tile is rebuilt
+        self._tile_signature = None
+        # Tile event handlers by event type, used by eventFilter
+        self._tile_event_handlers = {
+            QEvent.Type.MouseButtonPress: self._on_app_mouse_press,
+            QEvent.Type.MouseMove: self._on_app_mouse_move,
+            QEvent.Type.MouseButtonDblClick: self._on_app_double_clicked,
+            QEvent.Type.Enter: self._on_app_hover_enter,
+            QEvent.Type.Leave: self._on_app_hover_leave,
+            QEvent.Type.DragEnter: self._on_app_drag_enter,
+            QEvent.Type.DragLeave: self._on_app_drag_leave,
+            QEvent.Type.Drop: self._on_app_drop,
+        }
+        # Tile events the grid only observes; they are still delivered to the tile itself
+        self._tile_observed_events = {
+            QEvent.Type.Enter,
+            QEvent.Type.Leave,
+            QEvent.Type.DragEnter,
+            QEvent.Type.DragLeave,
+        }
+        # Icon labels waiting for a background icon load, by app path
+        self._icon_waiters = {}
+        # Blank pixmaps shown while an icon loads, by size
+        self._placeholder_pixmaps = {}
+        # Lowercased text of the last filter pass; "" while every tile is shown
+        self._filter_text = ""
         self.columns = 5  # Default number of columns
         self.icon_quality_settings = {}  # Store icon quality settings
         
@@ -834,7 +1411,34 @@ class AppGrid(QWidget):
         
         # Create content widget for the grid
         self.content_widget = QWidget()
-        self.content_widget.setStyleSheet("background-color: #333333;")
+        # Tiles are styled through this one sheet (by object name) instead of one sheet per tile;
+        # highlights switch the tile's "state" property rather than replacing a stylesheet
+        self.content_widget.setStyleSheet("""
+            * {
+                background-color: #333333;
+            }
+            
+            QWidget#AppTile {
+                background-color: #333333;
+                border-radius: 8px;
+                border: 1px solid transparent;
+            }
+            
+            QWidget#AppTile[state="hover"] {
+                background-color: #353535;
+                border: 1px solid #606060;
+            }
+            
+            QWidget#AppTile[state="clicked"] {
+                background-color: #383838;
+                border: 1px solid #606060;
+            }
+            
+            QWidget#AppTile[state="drop"] {
+                background-color: #2d2d2d;
+                border: 2px dashed #404040;
+            }
+        """)
         self.grid_layout = QGridLayout(self.content_widget)
         self.grid_layout.setSpacing(15)
         self.grid_layout.setContentsMargins(20, 20, 20, 20)
@@ -858,10 +1462,25 @@ class AppGrid(QWidget):
         
         self._last_clicked_app = None
 
-    def set_icon_quality_settings(self, settings: dict) -> None:
-        """Set the icon quality settings for the grid."""
+    def set_icon_quality_settings(self, settings: dict) -> bool:
+        """Set the icon quality settings for the grid.
+        
+        Returns True when the tiles were rebuilt, in which case every tile has already
+        requested its icon for the new settings.
+        """
         self.icon_quality_settings = settings
         
+        # Tiles can only be reused while their size, icon size and name display stay the same
+        signature = (
+            settings.get('widget_size', 100),
+            settings.get('show_names', True),
+            tuple(settings.get('preferred_source_sizes', [48])),
+        )
+        rebuilt = signature != self._tile_signature
+        if rebuilt:
+            self._tile_signature = signature
+            self.invalidate_tiles()
+        
         # Update columns if specified in settings
         if 'grid_columns' in settings:
             self.columns = settings['grid_columns']
@@ -869,6 +1488,7 @@ class AppGrid(QWidget):
         # Refresh the grid if apps are already populated to apply new settings
         if self.apps:
             self.populate(self.apps)
+        return rebuilt
     
     def set_columns(self, columns: int) -> None:
         """Set the number of columns in the grid."""
@@ -876,23 +1496,46 @@ class AppGrid(QWidget):
         if self.apps:
             self.populate(self.apps)
 
+    @contextmanager
+    def _batched_update(self):
+        """Suspend layout and painting of the grid while tiles are changed in bulk."""
+        self.content_widget.setUpdatesEnabled(False)
+        self.grid_layout.setEnabled(False)
+        try:
+            yield
+        finally:
+            # Relayout once for everything added, moved or hidden, then repaint once
+            self.grid_layout.setEnabled(True)
+            self.grid_layout.invalidate()
+            self.content_widget.setUpdatesEnabled(True)
+            self.content_widget.update()
+
+    def invalidate_tiles(self) -> None:
+        """Make the next populate() rebuild every tile (e.g. after the icon cache was cleared)."""
+        # Tile pixmaps depend on the quality settings, so they are re-rendered too
+        QPixmapCache.clear()
+        self._clear_grid()
+
     def populate(self, apps: List[AppItem]) -> None:
-        """Populate the grid with applications."""
+        """Populate the grid with applications, reusing tiles for apps already shown."""
         self.apps = apps
-        # Ensure IconExtractor has the current quality settings before building widgets
+        # Ensure icon extraction uses the current quality settings before building widgets
         if hasattr(self, 'icon_quality_settings') and self.icon_quality_settings:
-            IconExtractor.set_icon_quality_settings(self.icon_quality_settings)
+            set_icon_quality_settings(self.icon_quality_settings)
         
-        self._clear_grid()
-        self._build_grid()
-        # Ensure no widgets appear focused on startup
-        self._clear_highlights()
+        # Rebuild in one batch so the grid relayouts and repaints once
+        with self._batched_update():
+            self._build_grid()
+            # Ensure no widgets appear focused on startup
+            self._clear_highlights()
 
     def _clear_grid(self) -> None:
         """Clear all app widgets from the grid."""
-        for widget in self.app_widgets:
+        for widget in self.app_widgets + self._free_widgets:
             widget.deleteLater()
         self.app_widgets.clear()
+        self._free_widgets.clear()
+        self._icon_waiters.clear()
         
         # Clear the grid layout
         while self.grid_layout.count():
@@ -901,178 +1544,268 @@ class AppGrid(QWidget):
                 child.widget().deleteLater()
 
     def _build_grid(self) -> None:
-        """Build the grid layout with app widgets."""
-        for i, app in enumerate(self.apps):
-            row = i // self.columns
-            col = i % self.columns
-            
-            app_widget = self._create_app_widget(app)
-            self.grid_layout.addWidget(app_widget, row, col)
-            self.app_widgets.append(app_widget)
-
-    def _create_app_widget(self, app: AppItem) -> QWidget:
-        """Create a widget for a single app item."""
-        widget = QWidget()
+        """Build the grid layout with app widgets.
         
-        # Get widget size from stored icon quality settings
-        widget_size = self.icon_quality_settings.get('widget_size', 100)
+        Tiles already showing an app are kept (only their data and name are refreshed),
+        tiles of removed apps go to a pool for reuse, and a tile is only re-added to the
+        layout when its (row, col) cell actually changes.
+        """
+        # A path can be pinned more than once, so each path maps to all of its tiles
+        old_by_path = {}
+        for widget in self.app_widgets:
+            old_by_path.setdefault(widget.app_data.path, []).append(widget)
+        widgets = []
+        for app in self.apps:
+            tiles = old_by_path.get(app.path)
+            widgets.append(tiles.pop(0) if tiles else None)
+        
+        # Tiles that were not reused (apps that are gone) become free for reuse
+        for tiles in old_by_path.values():
+            for widget in tiles:
+                self.grid_layout.removeWidget(widget)
+                widget.hide()
+                widget._grid_pos = None
+                self._free_widgets.append(widget)
         
-        widget.setFixedSize(widget_size, widget_size)  # Square size for consistent grid
-        widget.setCursor(Qt.PointingHandCursor)
-        # Enable drag and drop
-        widget.setAcceptDrops(True)
+        for i, app in enumerate(self.apps):
+            widget = widgets[i]
+            if widget is not None:
+                self._bind_app_widget(widget, app, update_icon=False)
+            elif self._free_widgets:
+                widget = self._free_widgets.pop()
+                self._bind_app_widget(widget, app, update_icon=True)
+            else:
+                widget = self._create_app_widget(app)
+            widgets[i] = widget
+            self._place_widget(widget, i)
+            widget.setVisible(True)
+        
+        self.app_widgets = widgets
+        # Every tile is visible again, so the next filter pass starts from scratch
+        self._filter_text = ""
+
+    def _place_widget(self, widget: QWidget, index: int) -> None:
+        """Put a tile in the grid cell for its index, re-adding it only if the cell changed."""
+        pos = divmod(index, self.columns)
+        if widget._grid_pos != pos:
+            if widget._grid_pos is not None:
+                self.grid_layout.removeWidget(widget)
+            self.grid_layout.addWidget(widget, *pos)
+            widget._grid_pos = pos
+
+    def append_items(self, items: List[AppItem]) -> None:
+        """Create tiles only for newly added apps, leaving existing tiles untouched.
         
-        # Apply dark theme styling to app widget
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: #2d2d2d;
-                border-radius: 8px;
-                border: 1px solid #404040;
-            }
-        """)
+        The items are expected to already be at the end of the list given to populate().
+        """
+        with self._batched_update():
+            for app in items:
+                row, col = divmod(len(self.app_widgets), self.columns)
+                if self._free_widgets:
+                    app_widget = self._free_widgets.pop()
+                    self._bind_app_widget(app_widget, app, update_icon=True)
+                else:
+                    app_widget = self._create_app_widget(app)
+                self.grid_layout.addWidget(app_widget, row, col)
+                app_widget._grid_pos = (row, col)
+                # Respect the active search, so the filtered view stays consistent
+                app_widget.setVisible(self._filter_text in app_widget._name_lower)
+                self.app_widgets.append(app_widget)
+
+    def add_item(self, app: AppItem) -> None:
+        """Create a tile for one newly appended app."""
+        self.append_items([app])
+
+    def _widget_index(self, app: AppItem) -> Optional[int]:
+        """Return the index of the tile showing an app, or None if it has no tile."""
+        for i, widget in enumerate(self.app_widgets):
+            if widget.app_data is app:
+                return i
+        return None
+
+    def remove_item(self, app: AppItem) -> None:
+        """Drop an app's tile and shift the tiles after it back by one cell.
         
-        # Store app data
+        The app is expected to already be gone from the list given to populate().
+        """
+        index = self._widget_index(app)
+        if index is None:
+            return
+        with self._batched_update():
+            widget = self.app_widgets.pop(index)
+            self.grid_layout.removeWidget(widget)
+            widget.hide()
+            widget._grid_pos = None
+            self._set_tile_state(widget, "")
+            widget._is_clicked = False
+            self._free_widgets.append(widget)
+            if self._last_clicked_app is widget.app_data:
+                self._last_clicked_app = None
+            for i in range(index, len(self.app_widgets)):
+                self._place_widget(self.app_widgets[i], i)
+
+    def update_item(self, app: AppItem, update_icon: bool = False) -> None:
+        """Refresh the name (and optionally the icon) of the tile showing an app."""
+        index = self._widget_index(app)
+        if index is not None:
+            widget = self.app_widgets[index]
+            self._bind_app_widget(widget, app, update_icon)
+            # The new name may (no longer) match the active filter
+            widget.setVisible(self._filter_text in widget._name_lower)
+
+    def refresh_icons(self) -> None:
+        """Re-render every tile's icon in place, e.g. after the icon cache was cleared."""
+        with self._batched_update():
+            for widget in self.app_widgets:
+                self._bind_app_widget(widget, widget.app_data, update_icon=True)
+
+    def _bind_app_widget(self, widget: QWidget, app: AppItem, update_icon: bool) -> None:
+        """Point an existing tile at an app, refreshing its name and optionally its icon."""
         widget.app_data = app
+        name = app.display_name()
+        if widget.text() != name:
+            widget.setText(name)
+            widget._name_lower = name.lower()
+            if not self.icon_quality_settings.get('show_names', True):
+                widget.setToolTip(name)
+        if update_icon:
+            widget.setPixmap(None)
+            self._set_tile_icon(widget, app)
+
+    def _set_tile_icon(self, tile: AppTile, app: AppItem, wait: bool = True) -> None:
+        """Extract the app's icon and show it in a tile.
         
-        # Layout for icon and text
-        layout = QVBoxLayout(widget)
-        layout.setAlignment(Qt.AlignCenter)
-        layout.setSpacing(8)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        # Icon
-        icon_label = QLabel()
+        With ``wait``, an icon whose raw image still has to come from the shell is loaded
+        on the thread pool and a blank placeholder is shown until it arrives.
+        """
+        # Get the preferred icon size from stored quality settings
+        preferred_size = self.icon_quality_settings.get('preferred_source_sizes', [48])
+        target_size = preferred_size[0] if preferred_size else 48
+        
+        # Tiles share one rendered pixmap per file and size; the tile only needs the
+        # pixmap, so the multi-size QIcon is not kept alive by it
+        key = f"{_resolved(app.path)}@{target_size}"
+        # Remember what the tile shows, so a late background load cannot overwrite a rebound tile
+        tile._icon_app = app
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            # Then the pixmap an earlier run rendered, which needs no icon extraction at all
+            use_disk_cache = self.icon_quality_settings.get('cache_enabled', True)
+            pixmap = None
+            if use_disk_cache:
+                render_tag = disk_cache_render_tag(self.icon_quality_settings)
+                pixmap = load_disk_cached_pixmap(app.path, target_size, render_tag)
+            if pixmap is None:
+                small = target_size <= 24
+                if wait and _win32() and not _has_raw_image(app.path, small):
+                    self._request_icon(tile, app, small)
+                    tile.setPixmap(self._placeholder_pixmap(target_size))
+                    return
+                pixmap = self._render_tile_pixmap(app, target_size)
+                if pixmap is None or pixmap.isNull():
+                    # Last resort: leave the tile without an icon
+                    return
+                # A generic fallback (e.g. after a temporary extraction failure) is only
+                # kept in memory, so the real icon is tried again on the next run
+                if use_disk_cache and not is_fallback_icon(app.path):
+                    store_disk_cached_pixmap(app.path, target_size, pixmap, render_tag)
+            QPixmapCache.insert(key, pixmap)
+        tile.setPixmap(pixmap)
+
+    def _placeholder_pixmap(self, size: int) -> QPixmap:
+        """Return a transparent pixmap that keeps a tile's icon space while loading."""
+        pixmap = self._placeholder_pixmaps.get(size)
+        if pixmap is None:
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.transparent)
+            self._placeholder_pixmaps[size] = pixmap
+        return pixmap
+
+    def _request_icon(self, tile: AppTile, app: AppItem, small: bool) -> None:
+        """Queue a background icon load for a tile; one load serves every tile of a path."""
+        waiters = self._icon_waiters.get(app.path)
+        if waiters is None:
+            waiters = self._icon_waiters[app.path] = []
+            # Joins the window's startup prefetch for this path if it is still running
+            _start_icon_load(app.path, (small,), self._on_icon_loaded)
+        waiters.append(tile)
+
+    def _on_icon_loaded(self, path: str) -> None:
+        """Show a background-loaded icon in the tiles still waiting for it."""
+        for tile in self._icon_waiters.pop(path, []):
+            app = tile._icon_app
+            # The tile may have been rebound to another app in the meantime
+            if app.path == path:
+                self._set_tile_icon(tile, app, wait=False)
+
+    def _render_tile_pixmap(self, app: AppItem, target_size: int) -> Optional[QPixmap]:
+        """Extract the app's icon and render it at the tile's icon size."""
         try:
-            # Get the preferred icon size from stored quality settings
-            preferred_size = self.icon_quality_settings.get('preferred_source_sizes', [48])
-            target_size = preferred_size[0] if preferred_size else 48
-            
             # Use the new quality-aware icon extraction method with selected size
-            icon = IconExtractor.extract_icon_with_quality(app.path, target_size)
+            icon = extract_icon_with_quality(app.path, target_size)
             if icon and not icon.isNull():
                 pixmap = icon.pixmap(target_size, target_size)
                 if not pixmap.isNull():
-                    icon_label.setPixmap(pixmap)
-                else:
-                    # Fallback to basic icon extraction
-                    fallback_icon = IconExtractor.extract_icon(app.path, target_size)
-                    if fallback_icon and not fallback_icon.isNull():
-                        icon_label.setPixmap(fallback_icon.pixmap(target_size, target_size))
-            else:
-                # Fallback to basic icon extraction
-                fallback_icon = IconExtractor.extract_icon(app.path, target_size)
-                if fallback_icon and not fallback_icon.isNull():
-                    icon_label.setPixmap(fallback_icon.pixmap(target_size, target_size))
-        except Exception as e:
+                    return pixmap
+            # Fallback to basic icon extraction
+            fallback_icon = extract_icon(app.path, target_size)
+            if fallback_icon and not fallback_icon.isNull():
+                return fallback_icon.pixmap(target_size, target_size)
+        except Exception:
             # If all else fails, try basic icon extraction
             try:
-                fallback_icon = IconExtractor.extract_icon(app.path, target_size)
+                fallback_icon = extract_icon(app.path, target_size)
                 if fallback_icon and not fallback_icon.isNull():
-                    icon_label.setPixmap(fallback_icon.pixmap(target_size, target_size))
+                    return fallback_icon.pixmap(target_size, target_size)
             except Exception:
-                # Last resort: leave icon label empty
                 pass
+        return None
+
+    def _create_app_widget(self, app: AppItem) -> AppTile:
+        """Create a widget for a single app item."""
+        # Only show the name under the icon if show_names is enabled
+        show_names = self.icon_quality_settings.get('show_names', True)
+        widget = AppTile(show_text=show_names)
         
-        icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                border: none;
-            }
-        """)
+        # Get widget size from stored icon quality settings
+        widget_size = self.icon_quality_settings.get('widget_size', 100)
         
-        # Text label
-        text_label = QLabel(app.display_name())
-        text_label.setAlignment(Qt.AlignCenter)
-        text_label.setWordWrap(True)
-        text_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                background: transparent;
-                border: none;
-                font-size: 11px;
-                font-weight: normal;
-                padding: 2px;
-            }
-        """)
+        widget.setFixedSize(widget_size, widget_size)  # Square size for consistent grid
+        widget.setCursor(Qt.PointingHandCursor)
+        # Enable drag and drop
+        widget.setAcceptDrops(True)
         
-        # Add widgets to layout
-        layout.addWidget(icon_label)
+        # Store app data
+        widget.app_data = app
         
-        # Only add text label if show_names is enabled
-        show_names = self.icon_quality_settings.get('show_names', True)
-        if show_names:
-            layout.addWidget(text_label)
-        else:
-            # When names are hidden, icon should be more centered
-            layout.setContentsMargins(5, 5, 5, 5)
-            layout.setSpacing(0)
+        # Icon and name
+        self._set_tile_icon(widget, app)
+        name = app.display_name()
+        widget.setText(name)
+        if not show_names:
             # Add tooltip so user can still see the name on hover
-            widget.setToolTip(app.display_name())
-        
-        # Store widget reference for event handlers to avoid circular references
-        widget._grid_parent = self
-        
-        # Connect mouse events using functools.partial to avoid lambda circular references
-        import functools
-        widget.mousePressEvent = functools.partial(self._on_app_mouse_press_wrapper, widget)
-        widget.mouseMoveEvent = functools.partial(self._on_app_mouse_move_wrapper, widget)
-        widget.mouseDoubleClickEvent = functools.partial(self._on_app_double_clicked_wrapper, widget)
-        widget.enterEvent = functools.partial(self._on_app_hover_enter_wrapper, widget)
-        widget.leaveEvent = functools.partial(self._on_app_hover_leave_wrapper, widget)
-        # Add drag and drop event handlers
-        widget.dragEnterEvent = functools.partial(self._on_app_drag_enter_wrapper, widget)
-        widget.dragLeaveEvent = functools.partial(self._on_app_drag_leave_wrapper, widget)
-        widget.dropEvent = functools.partial(self._on_app_drop_wrapper, widget)
+            widget.setToolTip(name)
+        
+        widget._grid_pos = None
+        # Set while the tile is the clicked (selected) one
+        widget._is_clicked = False
+        # Lowercased name matched by filter() on every keystroke
+        widget._name_lower = name.lower()
+        
+        # Mouse and drag events of every tile go through the grid's eventFilter
+        widget.installEventFilter(self)
         
         return widget
 
-    # Event handler wrappers to avoid circular references from lambda functions
-    def _on_app_mouse_press_wrapper(self, widget, event):
-        """Wrapper for mouse press event."""
-        return self._on_app_mouse_press(event, widget)
-    
-    def _on_app_mouse_move_wrapper(self, widget, event):
-        """Wrapper for mouse move event."""
-        return self._on_app_mouse_move(event, widget)
-    
-    def _on_app_double_clicked_wrapper(self, widget, event):
-        """Wrapper for double click event."""
-        return self._on_app_double_clicked(event, widget)
-    
-    def _on_app_hover_enter_wrapper(self, widget, event):
-        """Wrapper for hover enter event."""
-        return self._on_app_hover_enter(event, widget)
-    
-    def _on_app_hover_leave_wrapper(self, widget, event):
-        """Wrapper for hover leave event."""
-        return self._on_app_hover_leave(event, widget)
-    
-    def _on_app_drag_enter_wrapper(self, widget, event):
-        """Wrapper for drag enter event."""
-        return self._on_app_drag_enter(event, widget)
-    
-    def _on_app_drag_leave_wrapper(self, widget, event):
-        """Wrapper for drag leave event."""
-        return self._on_app_drag_leave(event, widget)
-    
-    def _on_app_drop_wrapper(self, widget, event):
-        """Wrapper for drop event."""
-        return self._on_app_drop(event, widget)
-
-    def _on_app_clicked(self, event, widget):
-        """Handle single click on app widget."""
-        if event.button() == Qt.LeftButton:
-            self._last_clicked_app = widget.app_data
-            # Highlight the clicked widget
-            self._clear_highlights()
-            widget._is_clicked = True
-            widget.setStyleSheet("""
-                QWidget {
-                    background-color: rgba(45, 55, 72, 0.1);
-                    border-radius: 8px;
-                }
-            """)
+    def eventFilter(self, obj, event):
+        """Dispatch mouse, hover and drag events of the app tiles (the only watched objects)."""
+        event_type = event.type()
+        handler = self._tile_event_handlers.get(event_type)
+        if handler is not None:
+            handler(event, obj)
+            # Clicks, drags and drops are consumed; hover and drag enter/leave pass through
+            return event_type not in self._tile_observed_events
+        return super().eventFilter(obj, event)
 
     def _on_app_double_clicked(self, event, widget):
         """Handle double click on app widget."""
@@ -1083,57 +1816,48 @@ class AppGrid(QWidget):
 
     def _on_app_hover_enter(self, event, widget):
         """Handle mouse enter on app widget."""
-        if not hasattr(widget, '_is_clicked') or not widget._is_clicked:
-            widget.setStyleSheet("""
-                QWidget {
-                    background-color: #353535;
-                    border-radius: 8px;
-                    border: 1px solid #606060;
-                }
-            """)
+        # Enter/leave also fire without a real state change (tooltips, relayouts);
+        # _set_tile_state() returns early when the tile is already in that state
+        if not widget._is_clicked:
+            self._set_tile_state(widget, "hover")
 
     def _on_app_hover_leave(self, event, widget):
         """Handle mouse leave on app widget."""
-        if not hasattr(widget, '_is_clicked') or not widget._is_clicked:
+        if not widget._is_clicked:
             # Return to default app widget styling
-            widget.setStyleSheet("""
-                QWidget {
-                    background-color: #333333;
-                    border-radius: 8px;
-                    border: 1px solid transparent;
-                }
-            """)
+            self._set_tile_state(widget, "")
 
     def _on_app_mouse_press(self, event, widget):
         """Handle mouse press on app widget - handles both click and drag start."""
         if event.button() == Qt.LeftButton:
             # Store the widget for potential drag operation
             self._drag_start_widget = widget
-            self._drag_start_pos = event.position().toPoint()
+            pos = event.position()
+            self._drag_start_pos = (pos.x(), pos.y())
             # Handle click
             self._on_app_clicked(event, widget)
 
     def _on_app_clicked(self, event, widget):
-        """Handle single click on app widget."""
+        """Select and highlight an app widget (left click, or right click before its menu).
+        
+        ``event`` may be None; the left-button check is done by the caller.
+        """
         self._last_clicked_app = widget.app_data
         # Highlight the clicked widget
         self._clear_highlights()
         widget._is_clicked = True
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: #383838;
-                border-radius: 8px;
-                border: 1px solid #606060;
-            }
-        """)
+        self._set_tile_state(widget, "clicked")
 
     def _on_app_mouse_move(self, event, widget):
         """Handle mouse move to start drag operation."""
-        if (hasattr(self, '_drag_start_widget') and 
-            self._drag_start_widget == widget and
-            hasattr(self, '_drag_start_pos') and
-            (event.position().toPoint() - self._drag_start_pos).manhattanLength() > 10):
-            
+        if self._drag_start_widget is not widget:
+            return
+        # Squared distance against the platform's drag threshold
+        pos = event.position()
+        dx = pos.x() - self._drag_start_pos[0]
+        dy = pos.y() - self._drag_start_pos[1]
+        threshold = QApplication.startDragDistance()
+        if dx * dx + dy * dy > threshold * threshold:
             # Start drag operation
             self._start_drag(widget, event)
 
@@ -1153,45 +1877,25 @@ class AppGrid(QWidget):
         result = drag.exec(Qt.MoveAction)
         
         # Clean up
-        if hasattr(self, '_drag_start_widget'):
-            delattr(self, '_drag_start_widget')
-        if hasattr(self, '_drag_start_pos'):
-            delattr(self, '_drag_start_pos')
+        self._drag_start_widget = None
+        self._drag_start_pos = None
 
     def _on_app_drag_enter(self, event, widget):
         """Handle drag enter event."""
         if event.mimeData().hasText():
             event.acceptProposedAction()
             # Highlight drop target
-            widget.setStyleSheet("""
-                QWidget {
-                    background-color: #2d2d2d;
-                    border-radius: 8px;
-                    border: 2px dashed #404040;
-                }
-            """)
+            self._set_tile_state(widget, "drop")
 
     def _on_app_drag_leave(self, event, widget):
         """Handle drag leave event."""
         # Clear the drop highlight
-        if not hasattr(widget, '_is_clicked') or not widget._is_clicked:
+        if not widget._is_clicked:
             # Return to default app widget styling
-            widget.setStyleSheet("""
-                QWidget {
-                    background-color: #333333;
-                    border-radius: 8px;
-                    border: 1px solid transparent;
-                }
-            """)
+            self._set_tile_state(widget, "")
         else:
             # Restore clicked state styling
-            widget.setStyleSheet("""
-                QWidget {
-                    background-color: #2d2d2d;
-                    border-radius: 8px;
-                    border: 1px solid #404040;
-                }
-            """)
+            self._set_tile_state(widget, "clicked")
 
     def _on_app_drop(self, event, widget):
         """Handle drop event to rearrange items."""
@@ -1201,26 +1905,22 @@ class AppGrid(QWidget):
                 target_index = self.app_widgets.index(widget)
                 
                 if source_index != target_index:
-                    # Rearrange the apps list
-                    app_item = self.apps.pop(source_index)
-                    self.apps.insert(target_index, app_item)
+                    # Rearrange the apps list and move the dragged tile with it
+                    self.apps.insert(target_index, self.apps.pop(source_index))
+                    self.app_widgets.insert(target_index, self.app_widgets.pop(source_index))
                     
-                    # Update the grid
-                    self.populate(self.apps)
+                    # Only the tiles between the two positions change cells; nothing is rebuilt
+                    with self._batched_update():
+                        for i in range(min(source_index, target_index), max(source_index, target_index) + 1):
+                            self._place_widget(self.app_widgets[i], i)
                     
-                    # Save the new order
+                    # Save the new order once the user stops reordering for a moment
                     main_window = self._find_main_window()
-                    if main_window and hasattr(main_window, 'config'):
-                        main_window.config.save_apps(self.apps)
+                    if main_window and hasattr(main_window, '_schedule_save'):
+                        main_window._schedule_save(500)
                     
                     # Clear the highlight - return to default styling
-                    widget.setStyleSheet("""
-                        QWidget {
-                            background-color: #333333;
-                            border-radius: 8px;
-                            border: 1px solid transparent;
-                        }
-                    """)
+                    self._set_tile_state(widget, "")
                     
             except (ValueError, IndexError):
                 pass
@@ -1242,126 +1942,84 @@ class AppGrid(QWidget):
         
         if child and hasattr(child, 'app_data'):
             # Select the item that was right-clicked
-            self._last_clicked_app = child.app_data
-            self._clear_highlights()
-            child._is_clicked = True
-            child.setStyleSheet("""
-                QWidget {
-                    background-color: #383838;
-                    border-radius: 8px;
-                    border: 1px solid #606060;
-                }
-            """)
+            self._on_app_clicked(None, child)
             
             self._show_context_menu(child.app_data, self.content_widget.mapToGlobal(pos))
 
-    def _show_context_menu(self, app: AppItem, global_pos):
-        """Show context menu for an app."""
-        menu = QMenu(self)
-        
-        # Apply dark context menu styling
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #404040;
-                border-radius: 0px;
-                padding: 4px 0px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 12px;
-            }
-            QMenu::item {
-                background-color: transparent;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 0px;
-            }
-            QMenu::item:selected {
-                background-color: #404040;
-                color: #ffffff;
-            }
-            QMenu::item:pressed {
-                background-color: #2a2a2a;
-                color: #ffffff;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #404040;
-                margin: 4px 8px;
-            }
-        """)
-        
-        # Check if it's a folder to show appropriate actions
-        is_folder = os.path.isdir(app.path)
-        
-        if is_folder:
+    def _context_menu(self, is_folder: bool) -> QMenu:
+        """Return the folder or file item menu, building both on first use."""
+        if self._folder_menu is None:
+            # Actions shared by both menus (a QAction can live in several menus)
+            self._act_rename = QAction("Rename", self)
+            self._act_diagnostics = QAction("Icon Diagnostics...", self)
+            self._act_remove = QAction("Unpin", self)
+            
             # Folder actions
-            open_action = menu.addAction("Open Folder")
-            open_loc_action = menu.addAction("Open parent folder")
-        else:
+            self._folder_menu = QMenu(self)
+            self._folder_menu.setStyleSheet(DARK_MENU_QSS)
+            self._act_open_folder = self._folder_menu.addAction("Open Folder")
+            self._act_open_parent = self._folder_menu.addAction("Open parent folder")
+            
             # File actions
-            run_action = menu.addAction("Run")
-            run_admin_action = menu.addAction("Run as administrator")
-            open_loc_action = menu.addAction("Open location")
+            self._file_menu = QMenu(self)
+            self._file_menu.setStyleSheet(DARK_MENU_QSS)
+            self._act_run = self._file_menu.addAction("Run")
+            self._act_run_admin = self._file_menu.addAction("Run as administrator")
+            self._act_open_location = self._file_menu.addAction("Open location")
+            
+            for menu in (self._folder_menu, self._file_menu):
+                menu.addAction(self._act_rename)
+                menu.addSeparator()
+                menu.addAction(self._act_diagnostics)
+                menu.addAction(self._act_remove)
+        return self._folder_menu if is_folder else self._file_menu
+
+    def _show_context_menu(self, app: AppItem, global_pos):
+        """Show context menu for an app."""
+        # The menus are built and styled once, then only exec()'d
+        action = self._context_menu(app.is_dir).exec(global_pos)
         
-        rename_action = menu.addAction("Rename")
-        menu.addSeparator()
-        icon_diagnostics_action = menu.addAction("Icon Diagnostics...")
-        remove_action = menu.addAction("Unpin")
-        
-        action = menu.exec(global_pos)
-        
-        if is_folder:
-            if action == open_action:
-                self._run_app(app)  # This will open the folder
-            elif action == open_loc_action:
-                self._open_location(app)
-            elif action == rename_action:
-                self._rename_app(app)
-            elif action == icon_diagnostics_action:
-                # Find the main window and call its method
-                main_window = self._find_main_window()
-                if main_window and hasattr(main_window, '_show_icon_diagnostics'):
-                    main_window._show_icon_diagnostics()
-            elif action == remove_action:
-                self._remove_app(app)
-        else:
-            if action == run_action:
-                self._run_app(app)
-            elif action == run_admin_action:
-                self._run_app_admin(app)
-            elif action == open_loc_action:
-                self._open_location(app)
-            elif action == rename_action:
-                self._rename_app(app)
-            elif action == icon_diagnostics_action:
-                # Find the main window and call its method
-                main_window = self._find_main_window()
-                if main_window and hasattr(main_window, '_show_icon_diagnostics'):
-                    main_window._show_icon_diagnostics()
-            elif action == remove_action:
-                self._remove_app(app)
+        if action is None:
+            return
+        if action is self._act_open_folder or action is self._act_run:
+            self._run_app(app)  # For a folder this opens it
+        elif action is self._act_run_admin:
+            self._run_app_admin(app)
+        elif action is self._act_open_parent or action is self._act_open_location:
+            self._open_location(app)
+        elif action is self._act_rename:
+            self._rename_app(app)
+        elif action is self._act_diagnostics:
+            # Find the main window and call its method
+            main_window = self._find_main_window()
+            if main_window and hasattr(main_window, '_show_icon_diagnostics'):
+                main_window._show_icon_diagnostics()
+        elif action is self._act_remove:
+            self._remove_app(app)
+
+    @staticmethod
+    def _set_tile_state(widget: QWidget, state: str) -> None:
+        """Switch a tile's highlight state; the grid stylesheet styles each state."""
+        if (widget.property("state") or "") == state:
+            return
+        widget.setProperty("state", state)
+        # Re-polish so the property selectors are matched again
+        widget.style().polish(widget)
+        widget.update()
 
     def _clear_highlights(self):
         """Clear all widget highlights."""
         for widget in self.app_widgets:
             # Reset to default app widget styling
-            widget.setStyleSheet("""
-                QWidget {
-                    background-color: #333333;
-                    border-radius: 8px;
-                    border: 1px solid transparent;
-                }
-            """)
-            if hasattr(widget, '_is_clicked'):
-                widget._is_clicked = False
+            self._set_tile_state(widget, "")
+            widget._is_clicked = False
 
     def _run_app(self, app: AppItem):
         """Run an application."""
         # Find the main window and call its method
         main_window = self._find_main_window()
         if main_window and hasattr(main_window, 'run_path'):
-            main_window.run_path(app.path)
+            main_window.run_path(app.path, is_dir=app.is_dir)
     
     def _show_item_missing_error(self, app: AppItem):
         """Show error when trying to run a missing item."""
@@ -1399,11 +2057,17 @@ class AppGrid(QWidget):
             main_window.remove_app(app)
 
     def _find_main_window(self):
-        """Find the main launcher window by traversing up the widget hierarchy."""
+        """Find the main launcher window by traversing up the widget hierarchy.
+        
+        The window is looked up once; the grid stays inside it for its whole lifetime.
+        """
+        if self._main_window is not None:
+            return self._main_window
         widget = self
         while widget:
             if hasattr(widget, 'config') and hasattr(widget, 'apps'):
                 # This is the main window
+                self._main_window = widget
                 return widget
             widget = widget.parent()
         return None
@@ -1411,10 +2075,17 @@ class AppGrid(QWidget):
     def filter(self, text: str) -> None:
         """Filter the grid based on search text."""
         text_lower = text.lower()
-        for widget in self.app_widgets:
-            app = widget.app_data
-            visible = text_lower in app.display_name().lower()
-            widget.setVisible(visible)
+        if text_lower == self._filter_text:
+            return
+        # Typing more characters can only hide tiles, so hidden ones need no check
+        narrowing = text_lower.startswith(self._filter_text)
+        self._filter_text = text_lower
+        # Batch the visibility flips so the grid relayouts and repaints once
+        with self._batched_update():
+            for widget in self.app_widgets:
+                if narrowing and widget.isHidden():
+                    continue
+                widget.setVisible(text_lower in widget._name_lower)
 
     def current_app(self) -> Optional[AppItem]:
         """Get the currently selected app."""
@@ -1431,10 +2102,28 @@ class AppGrid(QWidget):
 class LauncherWindow(MainWindowBase):
     """Enhanced launcher window that extends MainWindowBase with launcher functionality."""
     
+    # Launch failures, shown from the event loop instead of inside the launch call
+    launch_failed = Signal(str)
+    
     def __init__(self):
         super().__init__()
+        self.launch_failed.connect(self._show_launch_error, Qt.QueuedConnection)
         self.config = ConfigStore()
         self.apps: List[AppItem] = self.config.load_apps()
+        # Paths in self.apps, for O(1) "already pinned" checks when adding
+        self._app_paths = {a.path for a in self.apps}
+        # Set while a config save is queued, so bursts of edits write it only once
+        self._save_pending = False
+        # One writer thread, so app list snapshots reach the disk in the order they were taken
+        # (and don't queue behind icon loads on the global pool)
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        
+        # Default browse location for the add dialogs (Desktop instead of Start Menu Programs),
+        # resolved once since it does not change during a session
+        self._start_dir = os.path.expandvars(r"%USERPROFILE%\Desktop")
+        if not os.path.exists(self._start_dir):
+            self._start_dir = os.path.expanduser("~")
         
         # Icon quality settings - load from config file
         self.icon_quality_settings = self.config.load_icon_quality_settings()
@@ -1442,6 +2131,9 @@ class LauncherWindow(MainWindowBase):
         # Apply icon quality settings
         self._apply_icon_quality_settings()
         
+        # Start extracting icons now, so they are ready by the time the grid builds its tiles
+        self._prefetch_icons()
+        
         # Initialize force quit flag
         self._force_quit = False
         
@@ -1457,12 +2149,12 @@ class LauncherWindow(MainWindowBase):
         self.setWindowFlags(Qt.Window | Qt.WindowMinimizeButtonHint | Qt.WindowCloseButtonHint)
         
         # Set window icon for taskbar (different from UI icons) - after setting window flags
-        window_icon = QIcon("template_app/assets/icons/icon2.png")
+        window_icon = _load_app_icon(APP_ICON_PATH)
         if not window_icon.isNull():
             self.setWindowIcon(window_icon)
-            print(f"Window icon set successfully: {window_icon.availableSizes()}")
+            logger.debug("Window icon set successfully")
         else:
-            print("Failed to load window icon from template_app/assets/icons/icon2.png")
+            logger.warning("Failed to load window icon from %s", APP_ICON_PATH)
         
         # Enable high-quality rendering attributes but keep system background for proper taskbar behavior
         self.setAttribute(Qt.WA_TranslucentBackground, False)  # Changed to False
@@ -1548,70 +2240,26 @@ class LauncherWindow(MainWindowBase):
                     (screen.height() - height) // 2
                 )
         except Exception as e:
-            print(f"Error loading window position: {e}")
+            logger.error("Error loading window position: %s", e)
             # Fall back to default size and center
             self.resize(620, 620)
     
-    def _connect_window_events(self):
-        """Connect window events for position saving."""
-        # Initialize timers for debouncing save operations
-        self._position_save_timer = None
-        self._resize_save_timer = None
-    
-    def _save_current_position(self):
-        """Save the current window position and size to config."""
-        try:
-            # Don't save if window is minimized or maximized
-            if self.isMinimized() or self.isMaximized():
-                return
-                
-            pos = self.pos()
-            size = self.size()
-            self.config.save_window_position(pos.x(), pos.y(), size.width(), size.height())
-        except Exception as e:
-            print(f"Error saving window position: {e}")
-    
-    def moveEvent(self, event):
-        """Handle window move events to save position."""
-        super().moveEvent(event)
-        # Debounce the save operation
-        if hasattr(self, '_position_save_timer'):
-            if self._position_save_timer:
-                self._position_save_timer.stop()
-                self._position_save_timer.deleteLater()
-            
-            from PySide6.QtCore import QTimer
-            self._position_save_timer = QTimer()
-            self._position_save_timer.setSingleShot(True)
-            self._position_save_timer.timeout.connect(self._save_current_position)
-            self._position_save_timer.start(500)  # Save 500ms after moving stops
-    
-    def resizeEvent(self, event):
-        """Handle window resize events to save size."""
-        super().resizeEvent(event)
-        # Debounce the save operation
-        if hasattr(self, '_resize_save_timer'):
-            if self._resize_save_timer:
-                self._resize_save_timer.stop()
-                self._resize_save_timer.deleteLater()
-            
-            from PySide6.QtCore import QTimer
-            self._resize_save_timer = QTimer()
-            self._resize_save_timer.setSingleShot(True)
-            self._resize_save_timer.timeout.connect(self._save_current_position)
-            self._resize_save_timer.start(500)  # Save 500ms after resizing stops
-    
-    def _apply_icon_quality_settings(self):
-        """Apply the current icon quality settings to the IconExtractor."""
+    def _apply_icon_quality_settings(self) -> bool:
+        """Apply the current icon quality settings to the IconExtractor.
+        
+        Returns True when the app grid rebuilt its tiles for the new settings.
+        """
         IconExtractor.set_icon_quality_settings(self.icon_quality_settings)
         # Also update the AppGrid settings if it exists
+        tiles_rebuilt = False
         if hasattr(self, 'app_grid'):
-            self.app_grid.set_icon_quality_settings(self.icon_quality_settings)
+            tiles_rebuilt = self.app_grid.set_icon_quality_settings(self.icon_quality_settings)
         
         # Update header height if it has changed
         if hasattr(self, 'header_widget'):
             current_header_height = self.icon_quality_settings.get('header_height', 80)
             self.header_widget.setFixedHeight(current_header_height)
+        return tiles_rebuilt
     
     def _get_current_icon_size(self):
         """Get the current icon size being used in the launcher."""
@@ -1684,7 +2332,7 @@ class LauncherWindow(MainWindowBase):
         
         # Add info label about current icon size
         current_size_info = QLabel(f"Current: {self._get_current_icon_size()}x{self._get_current_icon_size()}")
-        current_size_info.setStyleSheet("color: #808080; font-size: 11px;")
+        current_size_info.setStyleSheet(DIALOG_HINT_QSS)
         icon_size_layout.addWidget(current_size_info)
         layout.addLayout(icon_size_layout)
         
@@ -1703,7 +2351,7 @@ class LauncherWindow(MainWindowBase):
         
         # Add info label about current widget size
         current_widget_info = QLabel(f"Current: {current_widget_size}x{current_widget_size}")
-        current_widget_info.setStyleSheet("color: #808080; font-size: 11px;")
+        current_widget_info.setStyleSheet(DIALOG_HINT_QSS)
         widget_size_layout.addWidget(current_widget_info)
         layout.addLayout(widget_size_layout)
         
@@ -1722,7 +2370,7 @@ class LauncherWindow(MainWindowBase):
         
         # Add info label about current grid columns
         current_columns_info = QLabel(f"Current: {current_grid_columns} columns")
-        current_columns_info.setStyleSheet("color: #808080; font-size: 11px;")
+        current_columns_info.setStyleSheet(DIALOG_HINT_QSS)
         grid_columns_layout.addWidget(current_columns_info)
         layout.addLayout(grid_columns_layout)
         
@@ -1741,7 +2389,7 @@ class LauncherWindow(MainWindowBase):
         
         # Add info label about current header height
         current_header_info = QLabel(f"Current: {current_header_height}px")
-        current_header_info.setStyleSheet("color: #808080; font-size: 11px;")
+        current_header_info.setStyleSheet(DIALOG_HINT_QSS)
         header_height_layout.addWidget(current_header_info)
         layout.addLayout(header_height_layout)
         
@@ -1834,10 +2482,11 @@ class LauncherWindow(MainWindowBase):
         
         # Get diagnostics
         diagnostics = IconExtractor.get_icon_diagnostics(selected_app.path)
+        app_name = selected_app.display_name()
         
         # Create dialog
         dialog = QDialog(self)
-        dialog.setWindowTitle(f"Icon Diagnostics - {selected_app.display_name()}")
+        dialog.setWindowTitle(f"Icon Diagnostics - {app_name}")
         dialog.setModal(True)
         dialog.resize(600, 500)
         
@@ -1853,7 +2502,7 @@ class LauncherWindow(MainWindowBase):
         layout = QVBoxLayout(dialog)
         
         # App info
-        app_info = QLabel(f"App: {selected_app.display_name()}\nPath: {selected_app.path}")
+        app_info = QLabel(f"App: {app_name}\nPath: {selected_app.path}")
         app_info.setStyleSheet("""
             font-weight: bold; 
             padding: 10px; 
@@ -1864,164 +2513,104 @@ class LauncherWindow(MainWindowBase):
         """)
         layout.addWidget(app_info)
         
-        # File status
-        status_text = f"File exists: {'✓' if diagnostics['file_exists'] else '✗'}\n"
-        status_text += f"File type: {diagnostics['file_type']}"
-        status_label = QLabel(status_text)
-        status_label.setStyleSheet("""
-            padding: 5px; 
-            background: #2d2d2d; 
-            border: 1px solid #404040;
-            border-radius: 4px;
-            color: #ffffff;
-        """)
-        layout.addWidget(status_label)
-        
-        # Extraction methods
-        methods_text = "Extraction methods:\n"
-        if diagnostics['extraction_methods']:
-            for method in diagnostics['extraction_methods']:
-                methods_text += f"  ✓ {method}\n"
-        else:
-            methods_text += "  ✗ None working\n"
-        
-        methods_label = QLabel(methods_text)
-        methods_label.setStyleSheet("""
-            padding: 5px; 
-            background: #2d2d2d; 
-            border: 1px solid #404040;
-            border-radius: 4px;
-            color: #ffffff;
-        """)
-        layout.addWidget(methods_label)
-        
-        # Available sizes
-        sizes_text = "Available icon sizes:\n"
-        if diagnostics['available_sizes']:
-            sizes_text += f"  {', '.join(map(str, diagnostics['available_sizes']))}\n"
-        else:
-            sizes_text += "  None\n"
+        # File status, extraction methods, sizes and any issues as one rich-text report,
+        # so the dialog lays out and polishes a single widget instead of one per section
+        import icon_diagnostics
+        report_textedit = QTextEdit()
+        report_textedit.setReadOnly(True)
+        report_textedit.setHtml(icon_diagnostics.diagnostics_html(diagnostics, IconExtractor.cache_info()))
         
-        sizes_label = QLabel(sizes_text)
-        sizes_label.setStyleSheet("""
-            padding: 5px; 
-            background: #2d2d2d; 
-            border: 1px solid #404040;
-            border-radius: 4px;
-            color: #ffffff;
-        """)
-        layout.addWidget(sizes_label)
-        
-        # Errors and recommendations
-        if diagnostics['errors'] or diagnostics['recommendations']:
-            issues_text = ""
-            if diagnostics['errors']:
-                issues_text += "Errors:\n"
-                for error in diagnostics['errors']:
-                    issues_text += f"  ✗ {error}\n"
-            
-            if diagnostics['recommendations']:
-                issues_text += "\nRecommendations:\n"
-                for rec in diagnostics['recommendations']:
-                    issues_text += f"  💡 {rec}\n"
-            
-            issues_textedit = QTextEdit()
-            issues_textedit.setPlainText(issues_text)
-            issues_textedit.setReadOnly(True)
-            issues_textedit.setMaximumHeight(150)
-            
-            # Apply modern scrollbar styling to the text edit
-            issues_textedit.setStyleSheet("""
-                QTextEdit {
-                    background-color: #2d2d2d;
-                    color: #ffffff;
-                    border: 1px solid #404040;
-                    border-radius: 6px;
-                    padding: 8px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-size: 12px;
-                }
-                
-                QTextEdit QScrollBar:vertical {
-                    background-color: rgba(45, 45, 45, 0.3);
-                    width: 16px;
-                    margin: 0px;
-                    border-radius: 8px;
-                    border: none;
-                }
-                
-                QTextEdit QScrollBar::handle:vertical {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #666666, stop:1 #777777);
-                    border-radius: 8px;
-                    min-height: 30px;
-                    margin: 2px;
-                    border: 2px solid transparent;
-                }
-                
-                QTextEdit QScrollBar::handle:vertical:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #777777, stop:1 #888888);
-                    border: 2px solid #999999;
-                }
-                
-                QTextEdit QScrollBar::handle:vertical:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #888888, stop:1 #999999);
-                    border: 2px solid #bbbbbb;
-                }
-                
-                QTextEdit QScrollBar::add-line:vertical, QTextEdit QScrollBar::sub-line:vertical {
-                    height: 0px;
-                    background: transparent;
-                }
-                
-                QTextEdit QScrollBar::add-page:vertical, QTextEdit QScrollBar::sub-page:vertical {
-                    background: rgba(45, 45, 45, 0.1);
-                }
-                
-                QTextEdit QScrollBar:horizontal {
-                    background-color: rgba(45, 45, 45, 0.3);
-                    height: 16px;
-                    margin: 0px;
-                    border-radius: 8px;
-                    border: none;
-                }
-                
-                QTextEdit QScrollBar::handle:horizontal {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #666666, stop:1 #777777);
-                    border-radius: 8px;
-                    min-width: 30px;
-                    min-height: 10px;
-                    margin: 2px;
-                    border: 2px solid transparent;
-                }
-                
-                QTextEdit QScrollBar::handle:horizontal:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #777777, stop:1 #888888);
-                    border: 2px solid #999999;
-                }
-                
-                QTextEdit QScrollBar::handle:horizontal:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #888888, stop:1 #999999);
-                    border: 2px solid #bbbbbb;
-                }
-                
-                QTextEdit QScrollBar::add-line:horizontal, QTextEdit QScrollBar::sub-line:horizontal {
-                    width: 0px;
-                    background: transparent;
-                }
-                
-                QTextEdit QScrollBar::add-page:horizontal, QTextEdit QScrollBar::sub-page:horizontal {
-                    background: rgba(45, 45, 45, 0.1);
-                }
-            """)
+        # Apply modern scrollbar styling to the text edit
+        report_textedit.setStyleSheet("""
+            QTextEdit {
+                background-color: #2d2d2d;
+                color: #ffffff;
+                border: 1px solid #404040;
+                border-radius: 6px;
+                padding: 8px;
+                font-family: 'Segoe UI', Arial, sans-serif;
+                font-size: 12px;
+            }
+            
+            QTextEdit QScrollBar:vertical {
+                background-color: rgba(45, 45, 45, 0.3);
+                width: 16px;
+                margin: 0px;
+                border-radius: 8px;
+                border: none;
+            }
+            
+            QTextEdit QScrollBar::handle:vertical {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #666666, stop:1 #777777);
+                border-radius: 8px;
+                min-height: 30px;
+                margin: 2px;
+                border: 2px solid transparent;
+            }
+            
+            QTextEdit QScrollBar::handle:vertical:hover {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #777777, stop:1 #888888);
+                border: 2px solid #999999;
+            }
+            
+            QTextEdit QScrollBar::handle:vertical:pressed {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #888888, stop:1 #999999);
+                border: 2px solid #bbbbbb;
+            }
+            
+            QTextEdit QScrollBar::add-line:vertical, QTextEdit QScrollBar::sub-line:vertical {
+                height: 0px;
+                background: transparent;
+            }
+            
+            QTextEdit QScrollBar::add-page:vertical, QTextEdit QScrollBar::sub-page:vertical {
+                background: rgba(45, 45, 45, 0.1);
+            }
+            
+            QTextEdit QScrollBar:horizontal {
+                background-color: rgba(45, 45, 45, 0.3);
+                height: 16px;
+                margin: 0px;
+                border-radius: 8px;
+                border: none;
+            }
+            
+            QTextEdit QScrollBar::handle:horizontal {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #666666, stop:1 #777777);
+                border-radius: 8px;
+                min-width: 30px;
+                min-height: 10px;
+                margin: 2px;
+                border: 2px solid transparent;
+            }
+            
+            QTextEdit QScrollBar::handle:horizontal:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #777777, stop:1 #888888);
+                border: 2px solid #999999;
+            }
+            
+            QTextEdit QScrollBar::handle:horizontal:pressed {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #888888, stop:1 #999999);
+                border: 2px solid #bbbbbb;
+            }
+            
+            QTextEdit QScrollBar::add-line:horizontal, QTextEdit QScrollBar::sub-line:horizontal {
+                width: 0px;
+                background: transparent;
+            }
             
-            layout.addWidget(QLabel("Issues and Recommendations:"))
-            layout.addWidget(issues_textedit)
+            QTextEdit QScrollBar::add-page:horizontal, QTextEdit QScrollBar::sub-page:horizontal {
+                background: rgba(45, 45, 45, 0.1);
+            }
+        """)
+        
+        layout.addWidget(report_textedit)
         
         # Action buttons
         button_layout = QHBoxLayout()
@@ -2031,14 +2620,18 @@ class LauncherWindow(MainWindowBase):
         test_btn.clicked.connect(lambda: self._test_icon_extraction(selected_app.path))
         button_layout.addWidget(test_btn)
         
+        # Status line for cache/refresh results, so they don't need a modal message box
+        status_label = QLabel()
+        status_label.setStyleSheet(DIALOG_HINT_QSS)
+        
         # Clear cache button
         clear_cache_btn = QPushButton("Clear Icon Cache")
-        clear_cache_btn.clicked.connect(self._clear_icon_cache)
+        clear_cache_btn.clicked.connect(lambda: self._clear_icon_cache(status_label))
         button_layout.addWidget(clear_cache_btn)
         
         # Refresh button
         refresh_btn = QPushButton("Refresh App Grid")
-        refresh_btn.clicked.connect(lambda: self._refresh_app_grid())
+        refresh_btn.clicked.connect(lambda: self._refresh_app_grid(status_label))
         button_layout.addWidget(refresh_btn)
         
         # Close button
@@ -2047,6 +2640,7 @@ class LauncherWindow(MainWindowBase):
         button_layout.addWidget(close_btn)
         
         layout.addLayout(button_layout)
+        layout.addWidget(status_label)
         
         # Add Ctrl+W shortcut to close dialog
         from PySide6.QtGui import QShortcut, QKeySequence
@@ -2202,38 +2796,54 @@ TRAY ICON:
                 ("Quality-aware extraction", lambda: IconExtractor.extract_icon_with_quality(file_path, 48))
             ]
             
-            results = []
-            for method_name, method_func in methods:
-                try:
-                    icon = method_func()
-                    if icon and not icon.isNull():
-                        sizes = icon.availableSizes()
-                        results.append(f"✓ {method_name}: {len(sizes)} sizes available")
-                    else:
-                        results.append(f"✗ {method_name}: Failed")
-                except Exception as e:
-                    results.append(f"✗ {method_name}: Error - {str(e)}")
-            
             # Show results
-            result_text = "Icon extraction test results:\n\n" + "\n".join(results)
+            result_text = "Icon extraction test results:\n\n" + "\n".join(self._icon_test_lines(methods))
             QMessageBox.information(self, "Icon Test Results", result_text)
             
         except Exception as e:
             QMessageBox.warning(self, "Test Error", f"Error testing icon extraction:\n{str(e)}")
     
-    def _clear_icon_cache(self):
+    @staticmethod
+    def _icon_test_lines(methods):
+        """Run each (name, extractor) pair and yield one result line per method."""
+        for method_name, method_func in methods:
+            try:
+                icon = method_func()
+                if icon and not icon.isNull():
+                    yield f"✓ {method_name}: {len(icon.availableSizes())} sizes available"
+                else:
+                    yield f"✗ {method_name}: Failed"
+            except Exception as e:
+                yield f"✗ {method_name}: Error - {str(e)}"
+    
+    def _toast(self, label: QLabel, message: str, timeout_ms: int = 2000) -> None:
+        """Show a short non-modal message in a status label and clear it after a timeout."""
+        label.setText(message)
+        # The timer is owned by the label, so it goes away with the dialog
+        timer = getattr(label, '_toast_timer', None)
+        if timer is None:
+            timer = QTimer(label)
+            timer.setSingleShot(True)
+            timer.timeout.connect(label.clear)
+            label._toast_timer = timer
+        timer.start(timeout_ms)
+    
+    def _clear_icon_cache(self, status_label: QLabel):
         """Clear the icon cache."""
         try:
             IconExtractor.clear_cache()
-            QMessageBox.information(self, "Cache Cleared", "Icon cache has been cleared successfully.")
+            # An explicit clear also drops the icons persisted on disk
+            prune_disk_cache(0)
+            self._toast(status_label, "Icon cache has been cleared successfully.")
         except Exception as e:
             QMessageBox.warning(self, "Cache Error", f"Error clearing cache:\n{str(e)}")
     
-    def _refresh_app_grid(self):
+    def _refresh_app_grid(self, status_label: QLabel):
         """Refresh the app grid to show updated icons."""
         try:
+            self.app_grid.invalidate_tiles()
             self.app_grid.populate(self.apps)
-            QMessageBox.information(self, "Refresh Complete", "App grid has been refreshed with updated icons.")
+            self._toast(status_label, "App grid has been refreshed with updated icons.")
         except Exception as e:
             QMessageBox.warning(self, "Refresh Error", f"Error refreshing app grid:\n{str(e)}")
     
@@ -2250,7 +2860,8 @@ TRAY ICON:
     def _apply_dark_title_bar_theme(self):
         """Apply dark title bar theme for Windows using Win32 API."""
         try:
-            if HAS_WIN32:
+            # Only ctypes/dwmapi is needed here, so don't pull in pywin32 just to check
+            if sys.platform == "win32":
                 # Get the window handle
                 hwnd = self.winId().__int__()
                 
@@ -2302,12 +2913,12 @@ TRAY ICON:
                 except Exception:
                     pass  # Fallback if not supported
                 
-                print("Dark title bar theme applied successfully")
+                logger.debug("Dark title bar theme applied successfully")
             else:
-                print("Win32 API not available - using fallback styling")
+                logger.debug("Not running on Windows - using fallback styling")
                 
         except Exception as e:
-            print(f"Error applying dark title bar theme: {e}")
+            logger.error("Error applying dark title bar theme: %s", e)
             # Fallback: Use Qt styling for title bar
             self._apply_fallback_title_bar_styling()
 
@@ -2338,10 +2949,10 @@ TRAY ICON:
                 # Also set the palette for this window
                 self.setPalette(palette)
                 
-                print("Fallback title bar styling applied")
+                logger.debug("Fallback title bar styling applied")
                 
         except Exception as e:
-            print(f"Error applying fallback title bar styling: {e}")
+            logger.error("Error applying fallback title bar styling: %s", e)
 
     def _refresh_dark_theme(self):
         """Refresh the dark theme and title bar styling."""
@@ -2372,10 +2983,10 @@ TRAY ICON:
             # Force a repaint
             self.update()
             
-            print("Dark theme refreshed successfully")
+            logger.debug("Dark theme refreshed successfully")
             
         except Exception as e:
-            print(f"Error refreshing dark theme: {e}")
+            logger.error("Error refreshing dark theme: %s", e)
     
     
     
@@ -2408,7 +3019,7 @@ TRAY ICON:
             self._minimize_animation.start()
             
         except Exception as e:
-            print(f"Error during minimize animation: {e}")
+            logger.error("Error during minimize animation: %s", e)
             # Fallback to normal hide if animation fails
             self.hide()
             self._show_tray_notification()
@@ -2426,7 +3037,7 @@ TRAY ICON:
                 self._minimize_animation.deleteLater()
                 self._minimize_animation = None
         except Exception as e:
-            print(f"Error completing minimize animation: {e}")
+            logger.error("Error completing minimize animation: %s", e)
 
     def _connect_window_events(self):
         """Connect window events for proper theme handling."""
@@ -2438,6 +3049,17 @@ TRAY ICON:
             # Connect show event to ensure theme is applied
             self.showEvent = self._on_show
             
+            # Position/size saves are debounced by one reusable single-shot timer each,
+            # so a native drag or resize only restarts a timer per event
+            self._position_save_timer = QTimer(self)
+            self._position_save_timer.setSingleShot(True)
+            self._position_save_timer.setInterval(500)  # Save after 500ms of no movement
+            self._position_save_timer.timeout.connect(self._save_current_position)
+            self._resize_save_timer = QTimer(self)
+            self._resize_save_timer.setSingleShot(True)
+            self._resize_save_timer.setInterval(300)  # Save after 300ms of no resizing
+            self._resize_save_timer.timeout.connect(self._save_current_position)
+            
             # Connect move event to save window position
             self.moveEvent = self._on_move
             
@@ -2446,10 +3068,10 @@ TRAY ICON:
             
             # Close event is now handled by the closeEvent method override
             
-            print("Window events connected successfully")
+            logger.debug("Window events connected successfully")
             
         except Exception as e:
-            print(f"Error connecting window events: {e}")
+            logger.error("Error connecting window events: %s", e)
 
     def _on_focus_in(self, event):
         """Handle focus in event."""
@@ -2472,7 +3094,7 @@ TRAY ICON:
                 self._save_current_position()
                 self._initial_position_saved = True
         except Exception as e:
-            print(f"Error saving initial position: {e}")
+            logger.error("Error saving initial position: %s", e)
         
         # No startup animation - window appears immediately
         # Animation only for tray restoration
@@ -2519,7 +3141,7 @@ TRAY ICON:
                 self._center_window_on_screen()
                 
         except Exception as e:
-            print(f"Error loading window position: {e}")
+            logger.error("Error loading window position: %s", e)
             # Fallback to centering on screen
             self._center_window_on_screen()
     
@@ -2534,44 +3156,20 @@ TRAY ICON:
                 y = screen_geometry.center().y() - window_geometry.height() // 2
                 self.move(x, y)
         except Exception as e:
-            print(f"Error centering window: {e}")
+            logger.error("Error centering window: %s", e)
     
     def _on_move(self, event):
         """Handle window move event to save position."""
-        try:
-            # Save position after a short delay to avoid excessive saves during dragging
-            if hasattr(self, '_position_save_timer'):
-                self._position_save_timer.stop()
-            else:
-                from PySide6.QtCore import QTimer
-                self._position_save_timer = QTimer()
-                self._position_save_timer.setSingleShot(True)
-                self._position_save_timer.timeout.connect(self._save_current_position)
-            
-            self._position_save_timer.start(500)  # Save after 500ms of no movement
-            
-        except Exception as e:
-            print(f"Error handling move event: {e}")
-        
+        # Save after a short delay to avoid excessive saves during dragging
+        if self._position_save_timer is not None:
+            self._position_save_timer.start()
         super().moveEvent(event)
     
     def _on_resize(self, event):
         """Handle window resize event to save position and size."""
-        try:
-            # Save position and size after a short delay to avoid excessive saves during resizing
-            if hasattr(self, '_resize_save_timer'):
-                self._resize_save_timer.stop()
-            else:
-                from PySide6.QtCore import QTimer
-                self._resize_save_timer = QTimer()
-                self._resize_save_timer.setSingleShot(True)
-                self._resize_save_timer.timeout.connect(self._save_current_position)
-            
-            self._resize_save_timer.start(300)  # Save after 300ms of no resizing
-            
-        except Exception as e:
-            print(f"Error handling resize event: {e}")
-        
+        # Save after a short delay to avoid excessive saves during resizing
+        if self._resize_save_timer is not None:
+            self._resize_save_timer.start()
         super().resizeEvent(event)
     
     def _save_current_position(self):
@@ -2588,7 +3186,7 @@ TRAY ICON:
                 client_geometry.height()
             )
         except Exception as e:
-            print(f"Error saving window position: {e}")
+            logger.error("Error saving window position: %s", e)
     
     def _on_close(self, event):
         """Handle window close event to save final position and exit program."""
@@ -2596,7 +3194,7 @@ TRAY ICON:
             # Save current position before exiting
             self._save_current_position()
         except Exception as e:
-            print(f"Error saving window position on close: {e}")
+            logger.error("Error saving window position on close: %s", e)
         
         # Hide tray icon if it exists
         app_instance = self._find_main_app()
@@ -2638,15 +3236,20 @@ TRAY ICON:
                 self._resize_save_timer.deleteLater()
                 self._resize_save_timer = None
             
+            # Flush any queued app list save and wait for in-flight writes
+            if getattr(self, '_save_pending', False):
+                self._do_save()
+            self._save_pool.waitForDone()
+            
             # Stop and clean up animations
             if hasattr(self, '_minimize_animation') and self._minimize_animation:
                 self._minimize_animation.stop()
                 self._minimize_animation.deleteLater()
                 self._minimize_animation = None
             
-            print("Resources cleaned up successfully")
+            logger.debug("Resources cleaned up successfully")
         except Exception as e:
-            print(f"Error cleaning up resources: {e}")
+            logger.error("Error cleaning up resources: %s", e)
     
     def _quit_app(self):
         """Quit the application."""
@@ -2654,7 +3257,7 @@ TRAY ICON:
         try:
             self._save_current_position()
         except Exception as e:
-            print(f"Error saving window position on exit: {e}")
+            logger.error("Error saving window position on exit: %s", e)
         
         # Hide tray icon if it exists
         app_instance = self._find_main_app()
@@ -2682,7 +3285,7 @@ TRAY ICON:
                     3000  # Show for 3 seconds
                 )
         except Exception as e:
-            print(f"Error showing tray notification: {e}")
+            logger.error("Error showing tray notification: %s", e)
     
     def _find_main_app(self):
         """Find the main application instance."""
@@ -2699,7 +3302,7 @@ TRAY ICON:
                 widget = widget.parent()
             return None
         except Exception as e:
-            print(f"Error finding main app: {e}")
+            logger.error("Error finding main app: %s", e)
             return None
 
     def _apply_icon_settings_dialog(self, dialog, icon_size, widget_size, grid_columns, header_height, high_quality, dpi_aware, show_names, cache_enabled, cache_size, scaling_method):
@@ -2752,14 +3355,17 @@ TRAY ICON:
         # Save settings to config file
         self.config.save_icon_quality_settings(self.icon_quality_settings)
         
-        # Apply the new settings
-        self._apply_icon_quality_settings()
-        
-        # Clear the icon cache to force regeneration with new settings
+        # Clear the icon cache first so tiles rebuilt for the new settings load their
+        # icons on the thread pool instead of rendering stale images on this thread
         IconExtractor.clear_cache()
         
-        # Refresh the app grid to show icons with new quality settings and widget sizes
-        self.app_grid.populate(self.apps)
+        # Apply the new settings
+        tiles_rebuilt = self._apply_icon_quality_settings()
+        
+        # Rebuilt tiles already requested their icons; reused tiles keep their old pixmap,
+        # so re-render them (a placeholder shows until the background load completes)
+        if not tiles_rebuilt:
+            self.app_grid.refresh_icons()
         
         
         dialog.accept()
@@ -2787,6 +3393,12 @@ TRAY ICON:
         self.filter_edit.setFixedWidth(250)
         self.filter_edit.setPlaceholderText("Search...")
         self.filter_edit.textChanged.connect(self.on_filter)
+        
+        # Coalesce fast typing into a single filter pass for the latest text
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self.app_grid.filter(self.filter_edit.text()))
         self.filter_edit.setStyleSheet("""
             QLineEdit {
                 background-color: #2d2d2d;
@@ -2930,127 +3542,31 @@ TRAY ICON:
         
         # Control buttons area
         controls_widget = QWidget()
-        controls_widget.setStyleSheet("""
-            QWidget {
-                background-color: #2F2F2F;
-                border: none;
-                border-radius: 0px;
-            }
-        """)
+        # One sheet for the bar and its buttons, parsed once
+        controls_widget.setStyleSheet(CONTROLS_QSS)
         controls_layout = QHBoxLayout(controls_widget)
         controls_layout.setContentsMargins(10, 10, 10, 10)
         
+        self.btn_more = QPushButton("Options")
+        self.btn_more.setFixedWidth(80)
+        self.btn_more.setFixedHeight(35)
+        self.btn_more.clicked.connect(self.on_more_menu)
+        
         self.btn_add = QPushButton("Add")
         self.btn_add.setFixedWidth(80)
         self.btn_add.setFixedHeight(35)
         self.btn_add.clicked.connect(self.on_add)
-        self.btn_add.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #404040;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #363636;
-                border-color: #606060;
-            }
-            QPushButton:pressed {
-                background-color: #1a1a1a;
-            }
-        """)
         
         self.btn_run = QPushButton("Run")
         self.btn_run.clicked.connect(self.on_run_selected)
         self.btn_run.setFixedWidth(80)
         self.btn_run.setFixedHeight(35)
-        self.btn_run.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #404040;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #363636;
-                border-color: #606060;
-            }
-            QPushButton:pressed {
-                background-color: #1a1a1a;
-            }
-        """)
         
-        self.btn_more = QPushButton("Options")
-        self.btn_more.setFixedWidth(80)
-        self.btn_more.setFixedHeight(35)
-        self.btn_more.clicked.connect(self.on_more_menu)
-        self.btn_more.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #404040;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #363636;
-                border-color: #606060;
-            }
-            QPushButton:pressed {
-                background-color: #1a1a1a;
-            }
-        """)
-
-        # Add minimize to tray button
-        self.btn_minimize = QPushButton("Minimize to Tray")
-        self.btn_minimize.setFixedWidth(120)
-        self.btn_minimize.setFixedHeight(35)
-        self.btn_minimize.clicked.connect(self._minimize_to_tray_with_animation)
-        self.btn_minimize.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #404040;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #363636;
-                border-color: #606060;
-            }
-            QPushButton:pressed {
-                background-color: #1a1a1a;
-            }
-        """)
-
         # Add close button
         self.btn_close = QPushButton("Exit")
         self.btn_close.setFixedWidth(80)
         self.btn_close.setFixedHeight(35)
         self.btn_close.clicked.connect(self._quit_app)
-        self.btn_close.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #404040;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #383838;
-                border-color: #606060;
-            }
-            QPushButton:pressed {
-                background-color: #1a1a1a;
-            }
-        """)
 
         controls_layout.addWidget(self.btn_more)
         controls_layout.addSpacing(5)
@@ -3070,6 +3586,10 @@ TRAY ICON:
         
         # Add splitter to body layout
         self.body_layout.addWidget(splitter)
+        
+        # Popup menus for the control buttons are built once and reused; the app item
+        # menus belong to AppGrid (see AppGrid._context_menu)
+        self._build_button_menus()
 
     def _focus_filter(self):
         """Focus the filter input field."""
@@ -3078,267 +3598,121 @@ TRAY ICON:
 
     def on_filter(self, text: str) -> None:
         """Filter the app grid based on search text."""
-        self.app_grid.filter(text)
+        # Restart the debounce timer; the filter runs once typing pauses
+        self._filter_timer.start()
+
+    def _build_button_menus(self):
+        """Build the Add and Options menus once so clicks only need to exec() them."""
+        # Menu to choose between files and folders
+        self._add_menu = QMenu(self)
+        self._add_menu.setStyleSheet(DARK_MENU_QSS)
+        self._add_files_action = self._add_menu.addAction("Add Files...")
+        self._add_folder_action = self._add_menu.addAction("Add Folder...")
+        
+        # More options menu
+        self._more_menu = QMenu(self)
+        self._more_menu.setStyleSheet(DARK_MENU_QSS)
+        self._icon_settings_action = self._more_menu.addAction("Quality Settings")
+        self._icon_diagnostics_action = self._more_menu.addAction("Icon Diagnostics")
+        self._more_menu.addSeparator()
+        self._shortcuts_action = self._more_menu.addAction("Keyboard Shortcuts")
+        self._more_menu.addSeparator()
+        self._refresh_theme_action = self._more_menu.addAction("Refresh Dark Theme")
+        self._more_menu.addSeparator()
+        self._minimize_to_tray_action = self._more_menu.addAction("Minimize to Tray")
+
+    def _global_below(self, btn):
+        """Return the global position just below the bottom-left corner of a button."""
+        return btn.mapToGlobal(btn.rect().bottomLeft())
 
     def on_add(self) -> None:
         """Add new apps to the launcher."""
-        # Show menu to choose between files and folders
-        menu = QMenu(self)
-        
-        # Apply dark context menu styling
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #404040;
-                border-radius: 0px;
-                padding: 4px 0px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 12px;
-            }
-            QMenu::item {
-                background-color: transparent;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 0px;
-            }
-            QMenu::item:selected {
-                background-color: #404040;
-                color: #ffffff;
-            }
-            QMenu::item:pressed {
-                background-color: #2a2a2a;
-                color: #ffffff;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #404040;
-                margin: 4px 8px;
-            }
-        """)
-        
-        add_files_action = menu.addAction("Add Files...")
-        add_folder_action = menu.addAction("Add Folder...")
-        
         # Position menu near the add button
-        button_pos = self.btn_add.mapToGlobal(self.btn_add.rect().bottomLeft())
-        action = menu.exec(button_pos)
+        action = self._add_menu.exec(self._global_below(self.btn_add))
         
-        if action == add_files_action:
+        if action == self._add_files_action:
             self.on_add_files()
-        elif action == add_folder_action:
+        elif action == self._add_folder_action:
             self.on_add_folder()
 
+    def on_more_menu(self) -> None:
+        """Show the more options menu."""
+        # Position menu near the button
+        action = self._more_menu.exec(self._global_below(self.btn_more))
+        
+        if action == self._icon_settings_action:
+            self._show_icon_quality_settings()
+        elif action == self._icon_diagnostics_action:
+            self._show_icon_diagnostics()
+        elif action == self._shortcuts_action:
+            self._show_keyboard_shortcuts()
+        elif action == self._refresh_theme_action:
+            self._refresh_dark_theme()
+        elif action == self._minimize_to_tray_action:
+            self._minimize_to_tray_with_animation()
+
     def on_add_files(self) -> None:
         """Add new files to the launcher."""
-        # Use Desktop as default location instead of Start Menu Programs
-        desktop_dir = os.path.expandvars(r"%USERPROFILE%\Desktop")
-        if not os.path.exists(desktop_dir):
-            desktop_dir = os.path.expanduser("~")
-            
         paths, _ = QFileDialog.getOpenFileNames(
             self, 
             "Select files to pin", 
-            desktop_dir,
-            "All Files (*.*)"
+            self._start_dir,
+            "All Files (*.*)",
+            options=PIN_DIALOG_OPTIONS
         )
         
         if not paths:
             return
             
+        new_apps: List[AppItem] = []
         for path in paths:
-            if path not in [app.path for app in self.apps]:
-                self.apps.append(AppItem(path=path))
+            if path not in self._app_paths:
+                self._app_paths.add(path)
+                new_app = AppItem(path=path)
+                self.apps.append(new_app)
+                new_apps.append(new_app)
         
-        self.config.save_apps(self.apps)
-        self.app_grid.populate(self.apps)
+        if not new_apps:
+            return
+        
+        self._schedule_save()
+        # Only build tiles for the newly pinned items
+        self.app_grid.append_items(new_apps)
 
     def on_add_folder(self) -> None:
         """Add a folder to the launcher."""
-        # Use Desktop as default location instead of Start Menu Programs
-        desktop_dir = os.path.expandvars(r"%USERPROFILE%\Desktop")
-        if not os.path.exists(desktop_dir):
-            desktop_dir = os.path.expanduser("~")
-            
         folder_path = QFileDialog.getExistingDirectory(
             self,
             "Select folder to pin",
-            desktop_dir
+            self._start_dir,
+            QFileDialog.Option.ShowDirsOnly | PIN_DIALOG_OPTIONS
         )
         
         if not folder_path:
             return
             
-        # Debug logging
-        print(f"Selected folder: {folder_path}")
-        print(f"Folder exists: {os.path.exists(folder_path)}")
-        print(f"Is directory: {os.path.isdir(folder_path)}")
-        print(f"Absolute path: {os.path.abspath(folder_path)}")
+        logger.debug("Selected folder: %s", folder_path)
             
         # Check if folder is already added
-        if folder_path not in [app.path for app in self.apps]:
-            self.apps.append(AppItem(path=folder_path))
-            self.config.save_apps(self.apps)
-            self.app_grid.populate(self.apps)
-            print(f"Folder added successfully: {folder_path}")
+        if folder_path not in self._app_paths:
+            self._app_paths.add(folder_path)
+            new_app = AppItem(path=folder_path)
+            self.apps.append(new_app)
+            self._schedule_save()
+            self.app_grid.add_item(new_app)
+            logger.debug("Folder added successfully: %s", folder_path)
         else:
-            print(f"Folder already exists in launcher: {folder_path}")
+            logger.debug("Folder already exists in launcher: %s", folder_path)
 
     def on_run_selected(self) -> None:
         """Run the currently selected app."""
         app = self.app_grid.current_app()
         if not app:
             return
-        self.run_path(app.path)
+        self.run_path(app.path, is_dir=app.is_dir)
         # Clear highlights after 1 second delay
         QTimer.singleShot(2500, self.app_grid._clear_highlights)
 
-    def on_more_menu(self) -> None:
-        """Show the more options menu."""
-        menu = QMenu(self)
-        
-        # Apply dark context menu styling
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #404040;
-                border-radius: 0px;
-                padding: 4px 0px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 12px;
-            }
-            QMenu::item {
-                background-color: transparent;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 0px;
-            }
-            QMenu::item:selected {
-                background-color: #404040;
-                color: #ffffff;
-            }
-            QMenu::item:pressed {
-                background-color: #2a2a2a;
-                color: #ffffff;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #404040;
-                margin: 4px 8px;
-            }
-        """)
-        
-
-        icon_settings_action = menu.addAction("Quality Settings")
-        icon_diagnostics_action = menu.addAction("Icon Diagnostics")
-        menu.addSeparator()
-        shortcuts_action = menu.addAction("Keyboard Shortcuts")
-        menu.addSeparator()
-        refresh_theme_action = menu.addAction("Refresh Dark Theme")
-        menu.addSeparator()
-        minimize_to_tray_action = menu.addAction("Minimize to Tray")
-        menu.addSeparator()        
-
-        # Position menu near the button
-        button_pos = self.btn_more.mapToGlobal(self.btn_more.rect().bottomLeft())
-        action = menu.exec(button_pos)
-        
-        if action == icon_settings_action:
-            self._show_icon_quality_settings()
-        elif action == icon_diagnostics_action:
-            self._show_icon_diagnostics()
-        elif action == shortcuts_action:
-            self._show_keyboard_shortcuts()
-        elif action == refresh_theme_action:
-            self._refresh_dark_theme()
-        elif action == minimize_to_tray_action:
-            self._minimize_to_tray_with_animation()
-
-
-    def open_context_menu(self, pos) -> None:
-        """Open context menu for right-click on app items."""
-        app = self.app_grid.app_at_pos(pos)
-        if not app:
-            return
-            
-        menu = QMenu(self)
-        
-        # Apply dark context menu styling
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #404040;
-                border-radius: 0px;
-                padding: 4px 0px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 12px;
-            }
-            QMenu::item {
-                background-color: transparent;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 0px;
-            }
-            QMenu::item:selected {
-                background-color: #404040;
-                color: #ffffff;
-            }
-            QMenu::item:pressed {
-                background-color: #2a2a2a;
-                color: #ffffff;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #404040;
-                margin: 4px 8px;
-            }
-        """)
-        
-        # Check if it's a folder to show appropriate actions
-        is_folder = os.path.isdir(app.path)
-        
-        if is_folder:
-            # Folder actions
-            open_action = menu.addAction("Open Folder")
-            open_loc_action = menu.addAction("Open parent folder")
-        else:
-            # File actions
-            run_action = menu.addAction("Run")
-            run_admin_action = menu.addAction("Run as administrator")
-            open_loc_action = menu.addAction("Open location")
-        
-        rename_action = menu.addAction("Rename")
-        menu.addSeparator()
-        icon_diagnostics_action = menu.addAction("Icon Diagnostics...")
-        remove_action = menu.addAction("Unpin")
-        
-        action = menu.exec(self.mapToGlobal(pos))
-        
-        if is_folder:
-            if action == open_action:
-                self.run_path(app.path)  # This will open the folder
-            elif action == open_loc_action:
-                self.open_location(app.path)
-            elif action == rename_action:
-                self.rename_app(app)
-            elif action == icon_diagnostics_action:
-                self._show_icon_diagnostics()
-            elif action == remove_action:
-                self.remove_app(app)
-        else:
-            if action == run_action:
-                self.run_path(app.path)
-            elif action == run_admin_action:
-                self.run_path_admin(app.path)
-            elif action == open_loc_action:
-                self.open_location(app.path)
-            elif action == rename_action:
-                self.rename_app(app)
-            elif action == remove_action:
-                self.remove_app(app)
-
     def rename_app(self, app: AppItem) -> None:
         """Rename an app item."""
         new_title, ok = QInputDialog.getText(
@@ -3351,8 +3725,46 @@ TRAY ICON:
             return
             
         app.title = new_title.strip() or None
-        self.config.save_apps(self.apps)
-        self.app_grid.populate(self.apps)
+        self._schedule_save()
+        self.app_grid.update_item(app)
+
+    def _prefetch_icons(self) -> None:
+        """Queue background icon loads for apps whose tile pixmap is not cached on disk.
+        
+        The disk cache is pruned and checked on a pool thread; the loads start from
+        ``_on_disk_cache_scanned`` once it reports the missing paths.
+        """
+        self._prefetch_sizes = self.icon_quality_settings.get('preferred_source_sizes', [48])[:1] or [48]
+        use_disk_cache = self.icon_quality_settings.get('cache_enabled', True)
+        # The render tag reads the screen's pixel ratio, so it is built here on the GUI thread
+        render_tag = disk_cache_render_tag(self.icon_quality_settings) if use_disk_cache else None
+        scan = _DiskCacheScanRunnable([app.path for app in self.apps], self._prefetch_sizes[0], render_tag)
+        # Keep the signals object alive until the scan has reported back
+        self._disk_scan_signals = scan.signals
+        scan.signals.done.connect(self._on_disk_cache_scanned)
+        QThreadPool.globalInstance().start(scan)
+
+    def _on_disk_cache_scanned(self, missing: list) -> None:
+        """Start background icon loads for the paths the disk cache had nothing for."""
+        self._disk_scan_signals = None
+        prewarm(missing, self._prefetch_sizes)
+
+    def _schedule_save(self, delay_ms: int = 0) -> None:
+        """Queue a background save of the app list for the next event loop iteration.
+        
+        A ``delay_ms`` lets rapid successive changes (e.g. several reorders) share one write.
+        """
+        if not self._save_pending:
+            self._save_pending = True
+            QTimer.singleShot(delay_ms, self._do_save)
+
+    def _do_save(self) -> None:
+        """Hand a snapshot of the app list to the save thread for writing."""
+        if not self._save_pending:
+            return
+        self._save_pending = False
+        # Copy the saved fields now; titles may change while the worker serializes them
+        self._save_pool.start(_SaveRunnable(self.config, ConfigStore.app_entries(self.apps)))
 
     def remove_app(self, app: AppItem) -> None:
         """Remove an app from the launcher."""
@@ -3365,40 +3777,37 @@ TRAY ICON:
         )
         
         if reply == QMessageBox.Yes:
-            self.apps = [a for a in self.apps if a.path != app.path]
-            self.config.save_apps(self.apps)
-            
-            # Update AppGrid with current icon quality settings BEFORE populating
-            self.app_grid.set_icon_quality_settings(self.icon_quality_settings)
-            
-            # Now populate with the updated settings
-            self.app_grid.populate(self.apps)
+            # Find the item itself; list.pop() is O(N) anyway, and identity stays
+            # correct after drag-and-drop reorders
+            for i, item in enumerate(self.apps):
+                if item is app:
+                    del self.apps[i]
+                    break
+            # A path pinned twice (possible in a hand-edited config) is still pinned
+            if not any(item.path == app.path for item in self.apps):
+                self._app_paths.discard(app.path)
+            self._schedule_save()
+            self.app_grid.remove_item(app)
 
     def open_location(self, path: str) -> None:
         """Open the folder containing the selected item."""
         try:
-            if os.path.isdir(path):
-                # For folders, open the parent directory
-                dir_path = str(Path(path).parent)
-            else:
-                # For files, open the directory containing the file
-                dir_path = str(Path(path).parent)
-            
-            # Only open if we have a valid parent directory (not root)
-            if dir_path and dir_path != path:
-                normalized_dir = os.path.normpath(dir_path)
-                print(f"Opening parent directory: {normalized_dir}")
-                subprocess.Popen(["explorer", normalized_dir], creationflags=subprocess.CREATE_NO_WINDOW)
-            else:
-                # If no parent directory (root drive), just open the item itself
-                normalized_path = os.path.normpath(path)
-                print(f"Opening item itself: {normalized_path}")
-                subprocess.Popen(["explorer", normalized_path], creationflags=subprocess.CREATE_NO_WINDOW)
+            # Folders open their parent directory, files the directory containing them
+            dir_path = os.path.dirname(path)
+            
+            # Only open the parent if there is one (not root); a root drive opens itself
+            target = dir_path if dir_path and dir_path != path else path
+            normalized_target = os.path.normpath(target)
+            logger.debug("Opening location: %s", normalized_target)
+            os.startfile(normalized_target)
         except Exception as e:
             QMessageBox.warning(self, APP_NAME, f"Failed to open location:\n{e}")
 
-    def run_path(self, path: str) -> None:
-        """Run a file with proper working directory or open a folder."""
+    def run_path(self, path: str, is_dir: Optional[bool] = None) -> None:
+        """Run a file with proper working directory or open a folder.
+        
+        ``is_dir`` may be passed by callers that already know the item type to skip the stat.
+        """
         try:
             # Check if the path exists before trying to run it
             if not os.path.exists(path):
@@ -3410,55 +3819,35 @@ TRAY ICON:
                 )
                 return
             
-            # Debug logging
-            print(f"run_path called with: {path}")
-            print(f"Path exists: {os.path.exists(path)}")
-            print(f"Is directory: {os.path.isdir(path)}")
-            print(f"Absolute path: {os.path.abspath(path)}")
+            logger.debug("run_path called with: %s", path)
             
             # Check if the path is a directory
-            if os.path.isdir(path):
+            if is_dir is None:
+                is_dir = os.path.isdir(path)
+            if is_dir:
                 # Open folder in Explorer - normalize path to Windows format
                 normalized_path = os.path.normpath(path)
-                print(f"Normalized path: {normalized_path}")
-                print(f"Opening folder in Explorer: {normalized_path}")
-                print(f"Explorer command: explorer \"{normalized_path}\"")
-                subprocess.Popen(["explorer", normalized_path], creationflags=subprocess.CREATE_NO_WINDOW)
+                logger.debug("Opening folder in Explorer: %s", normalized_path)
+                os.startfile(normalized_path)
             else:
                 # Run file with proper working directory
-                target_dir = str(Path(path).parent)
-                path_ps = path.replace("'", "''")
-                dir_ps = target_dir.replace("'", "''")
-                ps_cmd = [
-                    "powershell",
-                    "-NoProfile",
-                    "-WindowStyle",
-                    "Hidden",
-                    "-Command",
-                    f"Start-Process -FilePath '{path_ps}' -WorkingDirectory '{dir_ps}'"
-                ]
-                subprocess.Popen(ps_cmd, creationflags=subprocess.CREATE_NO_WINDOW)
+                target_dir = os.path.dirname(path)
+                _shell_execute(os.path.normpath(path), "open", target_dir)
         except Exception as e:
-            print(f"Error in run_path: {e}")
-            QMessageBox.warning(self, APP_NAME, f"Failed to run:\n{e}")
+            logger.error("Error in run_path: %s", e)
+            self.launch_failed.emit(f"Failed to run:\n{e}")
 
     def run_path_admin(self, path: str) -> None:
         """Run a file as administrator."""
-        ps_path = path.replace("'", "''")
-        target_dir = str(Path(path).parent)
-        ps_dir = target_dir.replace("'", "''")
-        ps_cmd = [
-            "powershell",
-            "-NoProfile",
-            "-WindowStyle",
-            "Hidden",
-            "-Command",
-            f"Start-Process -FilePath '{ps_path}' -WorkingDirectory '{ps_dir}' -Verb RunAs"
-        ]
+        target_dir = os.path.dirname(path)
         try:
-            subprocess.Popen(ps_cmd, creationflags=subprocess.CREATE_NO_WINDOW)
+            _shell_execute(os.path.normpath(path), "runas", target_dir)
         except Exception as e:
-            QMessageBox.warning(self, APP_NAME, f"Failed to run as admin:\n{e}")
+            self.launch_failed.emit(f"Failed to run as admin:\n{e}")
+
+    def _show_launch_error(self, message: str) -> None:
+        """Report a failed launch; connected queued, so it always runs on the GUI thread."""
+        QMessageBox.warning(self, APP_NAME, message)
 
 
 class LauncherApp:
@@ -3466,14 +3855,17 @@ class LauncherApp:
     
     def __init__(self):
         self.app = QApplication.instance() or QApplication(sys.argv)
+        # Room for the rendered tile pixmaps (in KB), shared across grid rebuilds; large
+        # icon sizes on high-DPI screens take up to ~256 KB per pixmap
+        QPixmapCache.setCacheLimit(10240)
         
         # Set application icon globally (affects taskbar)
-        app_icon = QIcon("template_app/assets/icons/icon2.png")
+        app_icon = _load_app_icon(APP_ICON_PATH)
         if not app_icon.isNull():
             self.app.setWindowIcon(app_icon)
-            print(f"Application icon set successfully: {app_icon.availableSizes()}")
+            logger.debug("Application icon set successfully")
         else:
-            print("Failed to load application icon from template_app/assets/icons/icon2.png")
+            logger.warning("Failed to load application icon from %s", APP_ICON_PATH)
         
         self.window = LauncherWindow()
         
@@ -3484,7 +3876,7 @@ class LauncherApp:
         """Set up the system tray icon."""
         # Check if system tray is available
         if not QSystemTrayIcon.isSystemTrayAvailable():
-            print("System tray is not available on this system")
+            logger.warning("System tray is not available on this system")
             self.tray = None
             return
         
@@ -3492,7 +3884,7 @@ class LauncherApp:
         self.tray = QSystemTrayIcon(self.window)
         
         # Set tray icon (use the same icon as the application)
-        app_icon = QIcon("template_app/assets/icons/icon2.png")
+        app_icon = _load_app_icon(APP_ICON_PATH)
         if not app_icon.isNull():
             self.tray.setIcon(app_icon)
         else:
@@ -3505,36 +3897,7 @@ class LauncherApp:
         menu = QMenu()
         
         # Apply dark context menu styling
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #404040;
-                border-radius: 0px;
-                padding: 4px 0px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 12px;
-            }
-            QMenu::item {
-                background-color: transparent;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 0px;
-            }
-            QMenu::item:selected {
-                background-color: #404040;
-                color: #ffffff;
-            }
-            QMenu::item:pressed {
-                background-color: #2a2a2a;
-                color: #ffffff;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #404040;
-                margin: 4px 8px;
-            }
-        """)
+        menu.setStyleSheet(DARK_MENU_QSS)
         
         # Add menu actions
         act_toggle = QAction("Show/Hide", self.tray)
@@ -3556,7 +3919,7 @@ class LauncherApp:
         # Show the tray icon
         self.tray.show()
         
-        print("Tray icon initialized successfully")
+        logger.debug("Tray icon initialized successfully")
 
     def _toggle_window(self):
         """Toggle window visibility based on current state."""
@@ -3566,11 +3929,11 @@ class LauncherApp:
             self.window.setWindowState(Qt.WindowNoState)
             self.window.raise_()
             self.window.activateWindow()
-            print("Restored from Windows minimized state")
+            logger.debug("Restored from Windows minimized state")
         elif self.window.isVisible():
             # Window is visible - minimize it like Windows titlebar minimize
             self.window.setWindowState(Qt.WindowMinimized)
-            print("Minimized window like Windows titlebar")
+            logger.debug("Minimized window like Windows titlebar")
         else:
             # Window is hidden in tray - show it with animation
             self._show_window_from_tray_with_animation()
@@ -3583,11 +3946,11 @@ class LauncherApp:
             self.window.setWindowState(Qt.WindowNoState)
             self.window.raise_()
             self.window.activateWindow()
-            print("Restored from Windows minimized state via context menu")
+            logger.debug("Restored from Windows minimized state via context menu")
         elif self.window.isVisible():
             # Window is visible - hide it to tray with animation (context menu behavior)
             self._hide_window_to_tray_with_animation()
-            print("Hidden to tray via context menu")
+            logger.debug("Hidden to tray via context menu")
         else:
             # Window is hidden in tray - show it with animation
             self._show_window_from_tray_with_animation()
@@ -3606,7 +3969,7 @@ class LauncherApp:
             # Force window to normal state (not minimized)
             if self.window.windowState() == Qt.WindowMinimized:
                 self.window.setWindowState(Qt.WindowNoState)
-                print("Forced window to normal state from minimized")
+                logger.debug("Forced window to normal state from minimized")
             
             # Set initial opacity to 0 (transparent) BEFORE showing the window
             self.window.setWindowOpacity(0.0)
@@ -3633,7 +3996,7 @@ class LauncherApp:
             self._fade_animation.start()
             
         except Exception as e:
-            print(f"Error during smooth animation: {e}")
+            logger.error("Error during smooth animation: %s", e)
             # Fallback to normal show if animation fails
             self.window.setWindowOpacity(1.0)  # Reset opacity
             self.window.show()
@@ -3653,7 +4016,7 @@ class LauncherApp:
                 self._fade_animation.deleteLater()
                 self._fade_animation = None
         except Exception as e:
-            print(f"Error clearing tray restoration flag: {e}")
+            logger.error("Error clearing tray restoration flag: %s", e)
     
     def _hide_window_to_tray_with_animation(self):
         """Hide window to tray with smooth fade-out animation."""
@@ -3680,7 +4043,7 @@ class LauncherApp:
             self._fade_out_animation.start()
             
         except Exception as e:
-            print(f"Error during hide animation: {e}")
+            logger.error("Error during hide animation: %s", e)
             # Fallback to normal hide if animation fails
             self.window.hide()
     
@@ -3696,7 +4059,7 @@ class LauncherApp:
                 self._fade_out_animation.deleteLater()
                 self._fade_out_animation = None
         except Exception as e:
-            print(f"Error completing hide animation: {e}")
+            logger.error("Error completing hide animation: %s", e)
 
     def _on_tray_activated(self, reason):
         """Handle tray icon activation."""
@@ -3736,9 +4099,9 @@ class LauncherApp:
                 self._fade_out_animation.deleteLater()
                 self._fade_out_animation = None
             
-            print("Launcher animations cleaned up successfully")
+            logger.debug("Launcher animations cleaned up successfully")
         except Exception as e:
-            print(f"Error cleaning up launcher animations: {e}")
+            logger.error("Error cleaning up launcher animations: %s", e)
 
     def run(self):
         """Run the application."""
@@ -3748,6 +4111,7 @@ class LauncherApp:
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=logging.INFO)
     app = LauncherApp()
     
     # Ensure proper cleanup on exit
@@ -3763,7 +4127,7 @@ def main():
             app.tray.hide()
         sys.exit(0)
     except Exception as e:
-        print(f"Application error: {e}")
+        logger.error("Application error: %s", e)
         if hasattr(app, 'tray') and app.tray:
             app.tray.hide()
         sys.exit(1)